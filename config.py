@@ -11,6 +11,12 @@ DB_FILE = "gemini_interactions.db"
 # Data File Configuration
 DATA_FILE = "art_pricing_data.csv"
 
+# Persistent cache of Gemini product-type requirements (shelve database)
+REQUIREMENTS_CACHE_FILE = "requirements_cache"
+
+# Log of price calculations, one JSON object per line
+CALCULATION_LOG_FILE = "calculation_log.jsonl"
+
 # UI Configuration
 WINDOW_MIN_WIDTH = 900
 WINDOW_MIN_HEIGHT = 700
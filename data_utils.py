@@ -3,9 +3,10 @@ Data utilities for the Cre8Worthy application.
 """
 import os
 import csv
+import json
 from PIL import Image, ImageTk
 from datetime import datetime
-from config import DATA_FILE
+from config import DATA_FILE, CALCULATION_LOG_FILE
 
 def initialize_data_file():
     """Initialize the data file with headers if it doesn't exist."""
@@ -26,6 +27,12 @@ def save_to_file(data):
         writer.writerow(data)
     return True
 
+def save_calculations_batch(entries):
+    """Append calculation log entries to the calculation log in a single write."""
+    with open(CALCULATION_LOG_FILE, 'a', encoding='utf-8') as file:
+        file.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+    return True
+
 def hex_with_opacity(hex_color, opacity=1.0):
     """Convert a hex color to a format with opacity that can be used in tkinter"""
     if (hex_color.startswith('#')):
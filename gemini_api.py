@@ -19,9 +19,24 @@ logging.basicConfig(
 
 logger = logging.getLogger("GeminiAPI")
 
+# Patterns used to pull prices out of free-text responses
+_PRICE_NUMBER_RE = re.compile(r'(\d+(?:\s*\d+)*)')
+_WHITESPACE_RE = re.compile(r'\s')
+
 # Configure Gemini API
 genai.configure(api_key=GEMINI_API_KEY)
 
+# One model instance, and with it one client connection, shared by all requests
+_MODEL_NAME = "gemini-2.0-flash"
+_model = None
+
+def _get_model():
+    """Return the shared Gemini model, creating it on first use"""
+    global _model
+    if _model is None:
+        _model = genai.GenerativeModel(model_name=_MODEL_NAME)
+    return _model
+
 def setup_database():
     """Set up the SQLite database for storing Gemini interactions"""
     conn = sqlite3.connect(DB_FILE)
@@ -95,11 +110,8 @@ def consult_api_gemini(prompt, request_type="general"):
     start_time = datetime.datetime.now()
     try:
         logger.debug(f">>> GEMINI API REQUEST: {prompt}")
-        # Initialize Gemini with the gemini-pro model
-        model = genai.GenerativeModel(model_name="gemini-2.0-flash")
-        
-        # Generate a response
-        response = model.generate_content(prompt)
+        # Generate a response with the shared model
+        response = _get_model().generate_content(prompt)
         
         # Return the text content from the response
         response_text = response.text
@@ -161,8 +173,11 @@ def verify_material_combination(type_produit, materiaux):
     """
     logger.debug(f"Verifying materials {materiaux} for {type_produit}")
     prompt = f"Is this combination of materials: {', '.join(materiaux)} realistic/feasible for creating a {type_produit}? Answer ONLY with 'yes' or 'no'."
-    response = consult_api_gemini(prompt, "material_combination_check").lower()
-    return "yes" in response
+    response = consult_api_gemini(prompt, "material_combination_check")
+    if response.startswith("API Error"):
+        # Don't report a failed request as a "no"
+        raise RuntimeError(response)
+    return "yes" in response.lower()
 
 def check_known_artist(artiste):
     """
@@ -182,10 +197,10 @@ def get_artist_price(artiste, type_produit):
     response = consult_api_gemini(prompt, "artist_price_check")
 
     # Try to extract a numeric value from the response
-    matches = re.findall(r'(\d+(?:\s*\d+)*)', response)
+    matches = _PRICE_NUMBER_RE.findall(response)
     if matches:
         # Take the average if there's a range
-        nums = [int(re.sub(r'\s', '', m)) for m in matches]
+        nums = [int(_WHITESPACE_RE.sub('', m)) for m in matches]
         result = sum(nums) / len(nums)
         logger.debug(f"Extracted price: {result}")
         return result
@@ -197,8 +212,11 @@ def verify_artistic_product(type_produit):
     """
     logger.debug(f"Verifying product type: {type_produit}")
     prompt = f"Is {type_produit} a valid type of artistic product? Answer ONLY with 'yes' or 'no'."
-    response = consult_api_gemini(prompt, "product_type_validation").lower()
-    return "yes" in response
+    response = consult_api_gemini(prompt, "product_type_validation")
+    if response.startswith("API Error"):
+        # Don't report a failed request as a "no"
+        raise RuntimeError(response)
+    return "yes" in response.lower()
 
 def verify_material(materiau):
     """
@@ -255,6 +273,9 @@ def get_recommended_materials(product_type):
     Do not include any explanation or text outside the JSON.
     """
     response = consult_api_gemini(prompt, "material_recommendation")
+    if response.startswith("API Error"):
+        # Don't parse the error message as a list of materials
+        raise RuntimeError(response)
     import json
     # Try to extract and parse JSON robustly
     try:
@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import gemini_api
 import data_utils
 import ui
 import admin
@@ -12,8 +11,7 @@ from pricing import calculate_price
 def main():
     # Enable debug logging
     logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    # Set debug level for UI and Gemini API modules
-    logging.getLogger("UI").setLevel(logging.DEBUG)
+    # Set debug level for the Gemini API module; the UI logger follows UI_DEBUG
     logging.getLogger("GeminiAPI").setLevel(logging.DEBUG)
     
     # Initialize application
@@ -66,6 +64,8 @@ def main():
 
     # Start the main loop
     root.mainloop()
+    # Tools > Exit leaves the main loop without closing the window
+    app.flush_calculation_log()
 
 def open_gemini_data_view(root):
     """Open the Gemini Data View to display AI interaction history"""
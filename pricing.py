@@ -1,31 +1,29 @@
 import re
-import gemini_api
 from datetime import datetime
 import data_utils
+from product_requirements import parse_requirements_text
 import logging
 
 logger = logging.getLogger("Pricing")
 
+# First integer in Gemini's market-demand answer
+_DEMAND_RE = re.compile(r"(\d+)")
+
 def calculate_price(values, type_produit, artiste, marche, materiaux_selectionnes, is_3d):
+    # Imported here so the Google SDK isn't loaded until a price is calculated
+    import gemini_api
+
     # Get product requirements to determine additional factors
     requirements = gemini_api.get_product_type_requirements(type_produit)
     # Convert requirements to dictionary if it's a string
     if isinstance(requirements, str):
-        req_str = requirements.lower()
-        requirements = {
-            "is_digital": "digital" in req_str,
-            "is_3d": any(term in req_str for term in ["3d", "three-dimensional", "sculpture", "installation"]),
-            "needs_height": "height" in req_str or "dimension" in req_str,
-            "needs_weight": "weight" in req_str or "mass" in req_str,
-            "needs_duration": "duration" in req_str or "length" in req_str,
-            "needs_resolution": "resolution" in req_str or "quality" in req_str
-        }
+        requirements = parse_requirements_text(requirements)
     is_digital = requirements.get("is_digital", False)
     
     # Market demand
     prompt_market = f"Rate from 1 to 10 the demand for {type_produit} in the {marche} market. Number only."
     market_result = gemini_api.consult_api_gemini(prompt_market)
-    match = re.search(r"(\d+)", market_result)
+    match = _DEMAND_RE.search(market_result)
     market_demand = int(match.group(1)) if match else 5
 
     # Check if the artist is known and get reference price
@@ -152,6 +150,6 @@ def calculate_price(values, type_produit, artiste, marche, materiaux_selectionne
         values["temps"], f"{price:.2f}", market_demand, gemini_price_response
     )
     data_utils.save_to_file(data_row)
-    print("prix", result['prix'])
+    logger.debug("prix %s", result['prix'])
 
     return result
@@ -0,0 +1,40 @@
+"""
+Parsing of Gemini's product-type requirements answers for the Cre8Worthy application.
+"""
+import re
+
+# Terms in Gemini's free-text answers that signal a requirement
+_DIGITAL_TERMS = ("digital",)
+_3D_TERMS = ("3d", "three-dimensional", "sculpture", "installation")
+_RESOLUTION_TERMS = ("resolution", "quality")
+
+# Gemini is asked for a dict of these flags...
+_REQUIREMENT_FLAGS_RE = re.compile(
+    r'\b(is_digital|is_2d|is_3d|needs_height|needs_weight|needs_duration|needs_resolution)[\'"]?\s*:\s*(true|false)\b'
+)
+# ...and these whole words set a flag when it answers in free text instead
+_REQUIREMENT_TERMS = (
+    ("is_digital", _DIGITAL_TERMS),
+    ("is_3d", _3D_TERMS),
+    ("needs_height", ("height", "dimension", "dimensions")),
+    ("needs_weight", ("weight", "mass")),
+    ("needs_duration", ("duration", "length")),
+    ("needs_resolution", _RESOLUTION_TERMS),
+)
+_REQUIREMENT_TERMS_RE = re.compile(r"\b(?:" + "|".join(
+    f"(?P<{flag}>{'|'.join(map(re.escape, terms))})"
+    for flag, terms in _REQUIREMENT_TERMS
+) + r")\b")
+
+def parse_requirements_text(text):
+    """Turn Gemini's textual requirements answer for a product type into a dict of flags"""
+    text = text.lower()
+    requirements = {flag: False for flag, _ in _REQUIREMENT_TERMS}
+    answered = _REQUIREMENT_FLAGS_RE.findall(text)
+    if answered:
+        for flag, value in answered:
+            requirements[flag] = value == "true"
+    else:
+        for match in _REQUIREMENT_TERMS_RE.finditer(text):
+            requirements[match.lastgroup] = True
+    return requirements
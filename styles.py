@@ -4,6 +4,12 @@ UI styling configuration for the Cre8Worthy application.
 import tkinter as tk
 from tkinter import ttk
 
+# Font configurations
+_FONT_DEFAULT = ('Segoe UI', 10)
+_FONT_HEADING = ('Segoe UI', 10, 'bold')
+_FONT_TITLE = ('Segoe UI', 12, 'bold')
+_FONT_SMALL = ('Segoe UI', 9)
+
 def hex_with_opacity(hex_color, opacity=1.0):
     """Convert a hex color to a format with opacity that can be used in tkinter"""
     if hex_color.startswith('#'):
@@ -60,19 +66,13 @@ def apply_styles(root):
     radius_md = 3
     radius_lg = 6
 
-    # Font configurations
-    default_font = ('Segoe UI', 10)
-    heading_font = ('Segoe UI', 10, 'bold')
-    title_font = ('Segoe UI', 12, 'bold')
-    small_font = ('Segoe UI', 9)
-
     # Configure base styles
     style.configure('.',
                    background=background_color,
                    foreground=text_primary_color,
                    fieldbackground=background_color,
                    borderwidth=1,
-                   font=default_font)
+                   font=_FONT_DEFAULT)
 
     # Frame styles
     style.configure('TFrame', background=background_color)
@@ -90,18 +90,18 @@ def apply_styles(root):
     style.configure('TLabelFrame.Label', 
                    background=background_color,
                    foreground=text_primary_color, 
-                   font=heading_font)
+                   font=_FONT_HEADING)
 
     # Specialized label styles
     style.configure('Title.TLabel', 
-                   font=title_font, 
+                   font=_FONT_TITLE, 
                    background=background_color,
                    padding=spacing_sm)
     style.configure('Heading.TLabel', 
-                   font=heading_font, 
+                   font=_FONT_HEADING, 
                    background=background_color)
     style.configure('Small.TLabel', 
-                   font=small_font, 
+                   font=_FONT_SMALL, 
                    background=background_color)
     style.configure('Error.TLabel', 
                    foreground=error_color, 
@@ -124,7 +124,7 @@ def apply_styles(root):
                    borderwidth=1,
                    padding=(spacing_md, spacing_sm),
                    relief=tk.FLAT,
-                   font=heading_font)
+                   font=_FONT_HEADING)
     style.map('TButton',
              background=[('active', primary_dark), ('pressed', primary_dark), ('disabled', surface_color)],
              foreground=[('disabled', text_disabled_color)],
@@ -155,15 +155,15 @@ def apply_styles(root):
 
     # Small button variant
     style.configure('Small.TButton',
-                   font=small_font,
+                   font=_FONT_SMALL,
                    padding=(spacing_sm, spacing_xs))
     style.configure('Small.Secondary.TButton',
-                   font=small_font,
+                   font=_FONT_SMALL,
                    padding=(spacing_sm, spacing_xs),
                    background=secondary_color,
                    foreground=text_on_secondary)
     style.configure('Small.Outline.TButton',
-                   font=small_font,
+                   font=_FONT_SMALL,
                    padding=(spacing_sm, spacing_xs),
                    background=background_color,
                    foreground=text_primary_color,
@@ -0,0 +1,36 @@
+"""
+Tests for parsing Gemini's requirements answers for custom product types.
+"""
+import unittest
+
+from product_requirements import parse_requirements_text
+
+
+class ParseRequirementsTextTest(unittest.TestCase):
+    def test_json_style_answer(self):
+        answer = '{"is_digital": false, "is_3d": true, "needs_height": true, "needs_weight": true}'
+        requirements = parse_requirements_text(answer)
+        self.assertTrue(requirements["is_3d"])
+        self.assertTrue(requirements["needs_height"])
+        self.assertTrue(requirements["needs_weight"])
+        self.assertFalse(requirements["is_digital"])
+        self.assertFalse(requirements["needs_duration"])
+
+    def test_python_style_answer(self):
+        answer = "{'needs_height': True, 'needs_weight': True, 'is_digital': False}"
+        requirements = parse_requirements_text(answer)
+        self.assertTrue(requirements["needs_height"])
+        self.assertTrue(requirements["needs_weight"])
+        self.assertFalse(requirements["is_digital"])
+        self.assertFalse(requirements["needs_resolution"])
+
+    def test_all_false_answer(self):
+        answer = ('{"is_digital": false, "is_2d": true, "is_3d": false, "needs_height": false, '
+                  '"needs_weight": false, "needs_duration": false, "needs_resolution": false}')
+        requirements = parse_requirements_text(answer)
+        self.assertTrue(requirements["is_2d"])
+        self.assertFalse(any(value for flag, value in requirements.items() if flag != "is_2d"))
+
+
+if __name__ == "__main__":
+    unittest.main()
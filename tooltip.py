@@ -2,79 +2,122 @@
 Tooltip functionality for the Cre8Worthy application.
 """
 import tkinter as tk
-from tkinter import ttk
 
-class ToolTip:
+class _TipState:
+    """Tooltip texts, shared window and hover state of one toplevel window"""
+    def __init__(self):
+        self.tips = {}  # Widget path name -> tooltip text
+        self.window = None
+        self.label = None
+        self.current = None
+        self.pending_id = None
+        self.x_root = self.y_root = 0
+
+class SharedToolTip:
     """
-    Creates a tooltip for a given widget.
+    Serves tooltips for many widgets from one set of class bindings and a
+    single reusable tooltip window per toplevel.
     """
-    def __init__(self, widget, text):
-        self.widget = widget
-        self.text = text
-        self.tooltip_window = None
-        self.x = self.y = 0
-        self.widget.bind("<Enter>", self.enter)
-        self.widget.bind("<Leave>", self.leave)
-        self.widget.bind("<Motion>", self.motion)
-        self.widget.bind("<ButtonPress>", self.leave)
-        self.delay = 1000  # Tooltip delay in milliseconds
-        self.id = None
-    
-    def enter(self, event=None):
-        self.schedule()
-    
-    def leave(self, event=None):
-        self.unschedule()
-        self.hide()
-    
-    def motion(self, event=None):
-        self.x = event.x
-        self.y = event.y
-        if self.tooltip_window:
-            self.tooltip_window.geometry(f"+{event.x_root+10}+{event.y_root+10}")
-    
-    def schedule(self):
-        self.unschedule()
-        self.id = self.widget.after(self.delay, self.show)
-    
-    def unschedule(self):
-        if self.id:
-            self.widget.after_cancel(self.id)
-            self.id = None
-    
-    def show(self, event=None):
-        if self.tooltip_window:
+    BINDTAG = "TooltipTarget"
+    delay = 1000  # Tooltip delay in milliseconds
+    _states = {}  # Toplevel widget -> _TipState
+    _installed = set()  # Tcl interpreters that already have the class bindings
+
+    @classmethod
+    def register(cls, widget, text):
+        """Show text as a tooltip when the pointer rests on widget"""
+        # Class bindings belong to a Tcl interpreter, so each Tk() needs its own
+        if widget.tk not in cls._installed:
+            widget.bind_class(cls.BINDTAG, "<Enter>", cls._on_enter)
+            widget.bind_class(cls.BINDTAG, "<Leave>", cls._on_leave)
+            widget.bind_class(cls.BINDTAG, "<ButtonPress>", cls._on_leave)
+            widget.bind_class(cls.BINDTAG, "<Motion>", cls._on_motion)
+            widget.bind_class(cls.BINDTAG, "<Destroy>", cls._on_destroy)
+            cls._installed.add(widget.tk)
+        widget.bindtags(widget.bindtags() + (cls.BINDTAG,))
+        cls._state(widget).tips[str(widget)] = text
+
+    @classmethod
+    def _state(cls, widget):
+        """Return the tooltip state of the toplevel that holds widget"""
+        toplevel = widget.winfo_toplevel()
+        state = cls._states.get(toplevel)
+        if state is None:
+            state = cls._states[toplevel] = _TipState()
+        return state
+
+    @classmethod
+    def _on_enter(cls, event):
+        state = cls._state(event.widget)
+        cls._unschedule(state, event.widget)
+        state.current = event.widget
+        state.x_root, state.y_root = event.x_root, event.y_root
+        state.pending_id = event.widget.after(cls.delay, cls._show, state)
+
+    @classmethod
+    def _on_leave(cls, event):
+        state = cls._state(event.widget)
+        cls._unschedule(state, event.widget)
+        state.current = None
+        cls._hide(state)
+
+    @classmethod
+    def _on_motion(cls, event):
+        state = cls._state(event.widget)
+        state.x_root, state.y_root = event.x_root, event.y_root
+        if state.current is event.widget and state.window is not None and state.window.winfo_viewable():
+            state.window.geometry(f"+{event.x_root+10}+{event.y_root+10}")
+
+    @classmethod
+    def _on_destroy(cls, event):
+        toplevel = event.widget.winfo_toplevel()
+        state = cls._states.get(toplevel)
+        if state is None:
+            return
+        state.tips.pop(str(event.widget), None)
+        if state.current is event.widget:
+            cls._unschedule(state, event.widget)
+            state.current = None
+            cls._hide(state)
+        if not state.tips:
+            # Last target of this toplevel is gone, so is the need for its window
+            if state.window is not None:
+                state.window.destroy()
+            del cls._states[toplevel]
+
+    @staticmethod
+    def _unschedule(state, widget):
+        if state.pending_id is not None:
+            widget.after_cancel(state.pending_id)
+            state.pending_id = None
+
+    @staticmethod
+    def _show(state):
+        state.pending_id = None
+        widget = state.current
+        if widget is None:
             return
-            
-        # Get screen position
-        x_root = self.widget.winfo_rootx() + self.x + 10
-        y_root = self.widget.winfo_rooty() + self.y + 10
-        
-        # Create a toplevel window
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True)  # Remove window decorations
-        self.tooltip_window.wm_geometry(f"+{x_root}+{y_root}")
-        
-        # Use a subtle background color with border
-        frame = ttk.Frame(self.tooltip_window, borderwidth=1, relief="solid")
-        frame.pack(fill="both", expand=True)
-        
-        # Create label for tooltip content
-        label = ttk.Label(
-            frame, 
-            text=self.text, 
-            justify="left", 
-            wraplength=300,
-            padding=(5, 3),
-            background="#fffbe6"  # Light yellow background
-        )
-        label.pack()
-    
-    def hide(self):
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        if state.window is None:
+            # Created once, then re-texted and moved for every target
+            state.window = tk.Toplevel(widget.winfo_toplevel())
+            state.window.wm_overrideredirect(True)  # Remove window decorations
+            state.label = tk.Label(
+                state.window,
+                justify="left",
+                wraplength=300,
+                padx=5,
+                pady=3,
+                background="#fffbe6",  # Light yellow background
+                relief="solid",
+                borderwidth=1
+            )
+            state.label.pack()
+        state.label.config(text=state.tips.get(str(widget), ""))
+        state.window.wm_geometry(f"+{state.x_root+10}+{state.y_root+10}")
+        state.window.deiconify()
+        state.window.lift()
 
-def add_tooltip(widget, text):
-    """Helper function to create a tooltip for a widget"""
-    return ToolTip(widget, text)
+    @staticmethod
+    def _hide(state):
+        if state.window is not None:
+            state.window.withdraw()
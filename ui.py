@@ -1,18 +1,28 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
-import gemini_api
 import data_utils
-import re
+import math
 from validation import validate_text_input, validate_numeric_input, validate_type_product, validate_materials, validate_market
 from pricing import calculate_price
-from tooltip import ToolTip
+from product_requirements import parse_requirements_text
+from tooltip import SharedToolTip
+from config import REQUIREMENTS_CACHE_FILE
 import logging
 import sys
+import os
+import functools
+import shelve
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 
 # Configure logging
 logger = logging.getLogger("UI")
-logger.setLevel(logging.DEBUG)
+# Debug output is opt-in through the UI_DEBUG environment variable
+logger.setLevel(logging.DEBUG if os.environ.get("UI_DEBUG") else logging.INFO)
 
 # Remove all existing handlers to avoid duplicates
 for handler in logger.handlers[:]:
@@ -25,6 +35,179 @@ if not logger.handlers:
     handler.setFormatter(formatter)
     logger.addHandler(handler)
 
+# gemini_api pulls in the Google SDK, so it is imported on first use rather than at startup
+_gemini_mod = None
+
+def _gemini():
+    """Return the gemini_api module, importing it on first use"""
+    global _gemini_mod
+    if _gemini_mod is None:
+        import gemini_api
+        _gemini_mod = gemini_api
+    return _gemini_mod
+
+# Resolution choices offered for digital products
+QUALITY_VALUES = ("SD (480p)", "HD (720p)", "Full HD (1080p)",
+                  "2K (1440p)", "4K (2160p)", "8K (4320p)")
+
+# Dimension and optional cost fields, in display order starting at row 5 of the cost section:
+# (key, label text, combobox values or None for an entry, widget attribute names, created eagerly)
+FIELD_SPECS = (
+    ("longueur", "Length (cm):", None, ("length_frame", "entry_length", "error_length"), True),
+    ("largeur", "Width (cm):", None, ("width_frame", "entry_width", "error_width"), True),
+    ("hauteur", "Height (cm):", None, ("height_frame", "entry_height", "error_height"), False),
+    ("poids", "Weight (kg):", None, ("weight_frame", "entry_weight", "error_weight"), False),
+    ("duration", "Duration (minutes):", None, ("duration_frame", "entry_duration", "error_duration"), False),
+    ("quality", "Resolution:", QUALITY_VALUES, ("quality_frame", "quality_combo", "error_quality"), False),
+)
+FIELD_ROWS = {spec[0]: row for row, spec in enumerate(FIELD_SPECS, start=5)}
+_FIELD_SPECS_BY_KEY = {spec[0]: spec for spec in FIELD_SPECS}
+
+# Optional fields shown for a submitted custom type, with the requirement
+# flags that call for each of them
+_OPTIONAL_FIELD_FLAGS = (
+    ("hauteur", ("needs_height", "is_3d")),
+    ("poids", ("needs_weight", "is_3d")),
+    ("duration", ("needs_duration",)),
+    ("quality", ("needs_resolution",))
+)
+
+# Rows offered for custom product types: each known requirement has its own
+# row, any other requirement borrows one of the generic rows
+_CUSTOM_FIELD_LABELS = {
+    "height": "Height (cm):",
+    "weight": "Weight (kg):",
+    "resolution": "Resolution:",
+    "duration": "Duration (min):"
+}
+_GENERIC_FIELD_SLOTS = ("dynamic_1", "dynamic_2", "dynamic_3", "dynamic_4")
+_CUSTOM_FIELDS_ROW = max(FIELD_ROWS.values()) + 1  # First row below the standard fields
+
+# Keys after which the custom product type is analyzed almost immediately; space and
+# comma are left out because types such as "oil painting" continue after them
+_END_OF_INPUT_KEYS = ("Return", "KP_Enter", "Tab")
+_END_OF_INPUT_CHARS = ".;!?"
+
+# Listbox contents of the materials section
+_CANVAS_MATERIALS = ("Canvas", "Cotton", "Linen", "Silk", "Paper", "Other")
+_OTHER_MATERIALS = ("Wood", "Acrylic", "Oil", "Clay", "Metal", "Glass", "Plastic", "Other")
+_DIGITAL_FORMATS = ("Source File", "PNG", "JPEG", "PDF", "SVG", "GIF", "Other")
+_DIGITAL_TECHNIQUES = ("Digital Drawing", "Generated", "Edited", "Animated", "Interactive", "Coded", "Other")
+
+# Frame titles and default listbox contents of the materials section
+_MAT_PRESETS = {
+    "physical": ("Canvas Materials", "Other Materials", _CANVAS_MATERIALS, _OTHER_MATERIALS),
+    "digital": ("Digital Assets", "Digital Effects", _DIGITAL_FORMATS, _DIGITAL_TECHNIQUES)
+}
+
+# Category of the built-in product types, decides units and optional fields
+_TYPE_CATEGORY = {
+    "Sculpture": "3d",
+    "Installation": "3d",
+    "Ceramics": "3d",
+    "Photography": "photography",
+    "Digital": "digital",
+    "Video": "video"
+}
+
+# Video types that also ask for a quality level
+_QUALITY_VIDEO_TYPES = frozenset({"Short Film", "Documentary", "Animation"})
+
+def _is_digital_product(product_type, photo_type):
+    """Whether a product type is measured in pixels rather than centimeters"""
+    category = _TYPE_CATEGORY.get(product_type)
+    return category in ("digital", "video") or (category == "photography" and photo_type == "Digital")
+
+def _to_float(text):
+    """Parse a numeric entry, treating empty or invalid input as 0"""
+    text = text.strip()
+    if not text:
+        return 0.0
+    try:
+        return float(text)
+    except ValueError:
+        return 0.0
+
+@dataclass(frozen=True, slots=True)
+class Requirements:
+    """Which optional cost fields and units a product type needs"""
+    is_digital: bool = False
+    is_3d: bool = False
+    is_2d: bool = False
+    needs_height: bool = False
+    needs_weight: bool = False
+    needs_duration: bool = False
+    needs_resolution: bool = False
+
+# Requirements used when Gemini can't be reached
+_DEFAULT_REQUIREMENTS = Requirements()
+
+# Requirements of common product types typed as a custom type, answered without asking Gemini
+_STATIC_REQUIREMENTS = {
+    "painting": {"is_2d": True},
+    "drawing": {"is_2d": True},
+    "photography": {"is_digital": True, "needs_resolution": True},
+    "digital": {"is_digital": True, "needs_resolution": True},
+    "digital art": {"is_digital": True, "needs_resolution": True},
+    "video": {"is_digital": True, "needs_duration": True},
+    "sculpture": {"is_3d": True, "needs_height": True, "needs_weight": True},
+    "ceramics": {"is_3d": True, "needs_height": True, "needs_weight": True},
+    "installation": {"is_3d": True, "needs_height": True, "needs_weight": True}
+}
+
+# The requirements database is shared with the UI's worker threads
+_requirements_cache_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=128)
+def _cached_requirements(product_type_key):
+    """
+    Memoized Gemini product-type requirements, keyed by the normalized type name.
+    Answers are also kept on disk so they survive application restarts.
+    """
+    try:
+        with _requirements_cache_lock, shelve.open(REQUIREMENTS_CACHE_FILE) as cache:
+            if product_type_key in cache:
+                return cache[product_type_key]
+    except Exception as e:
+        logger.warning("Could not read requirements cache: %s", e)
+
+    requirements = _gemini().get_product_type_requirements(product_type_key)
+    if isinstance(requirements, str) and requirements.startswith("API Error"):
+        # Don't memoize transient API failures
+        raise RuntimeError(requirements)
+
+    try:
+        with _requirements_cache_lock, shelve.open(REQUIREMENTS_CACHE_FILE) as cache:
+            cache[product_type_key] = requirements
+    except Exception as e:
+        logger.warning("Could not write requirements cache: %s", e)
+    return requirements
+
+def _custom_type_requirements(product_type_key):
+    """Requirements of a normalized custom type, from the static table when it is a common type"""
+    requirements = _STATIC_REQUIREMENTS.get(product_type_key)
+    if requirements is None:
+        requirements = _cached_requirements(product_type_key)
+    return requirements
+
+@functools.lru_cache(maxsize=64)
+def _cached_is_artistic(product_type_key):
+    """Memoized Gemini check that a normalized custom type is an artistic product"""
+    return _gemini().verify_artistic_product(product_type_key)
+
+@functools.lru_cache(maxsize=64)
+def _cached_materials(product_type):
+    """Memoized Gemini material recommendations; callers must not modify the result"""
+    return _gemini().get_recommended_materials(product_type)
+
+@functools.lru_cache(maxsize=64)
+def _classify_requirements(product_type_key):
+    """Return the Requirements for a normalized product type"""
+    requirements = _cached_requirements(product_type_key)
+    if isinstance(requirements, str):
+        requirements = parse_requirements_text(requirements)
+    return Requirements(**{f.name: bool(requirements.get(f.name, False)) for f in fields(Requirements)})
+
 class LoadingScreen:
     """Full-screen loading overlay for showing busy state during AI operations"""
     def __init__(self, parent, message="Processing..."):
@@ -54,9 +237,8 @@ class LoadingScreen:
         self.spinner.start()
         
     def update_message(self, message):
-        """Update the loading screen message"""
+        """Update the loading screen message; Tk redraws the label once at idle time"""
         self.message_var.set(message)
-        self.parent.update_idletasks()
     
     def hide(self):
         """Hide the loading screen"""
@@ -65,6 +247,9 @@ class LoadingScreen:
 
 class LoadingSpinner:
     """Loading spinner widget for showing busy state during operations"""
+    # Use a series of blue shades instead of opacity which might not be supported
+    COLORS = ("#2563eb", "#2563eb", "#3b74ec", "#517eee", "#668fef", "#7c9ff1", "#91b0f3", "#a7c0f5")
+
     def __init__(self, parent, size=30):
         self.parent = parent
         self.size = size
@@ -72,60 +257,69 @@ class LoadingSpinner:
                                highlightthickness=0)
         self.angle = 0
         self.is_running = False
+        # Unit vectors for the eight segments, 45 degrees apart
+        self._base = [(math.cos(math.radians(i * 45)), math.sin(math.radians(i * 45))) for i in range(8)]
+        self._lines = []  # Canvas line items, created once and moved on each frame
+        self._pending_after = None  # Only one animation callback may be outstanding
         self.canvas.pack()
     
     def start(self):
         """Start the spinner animation"""
         self.is_running = True
-        self.canvas.delete("spinner")
-        self._animate()
+        if not self._lines:
+            self._lines = [
+                self.canvas.create_line(0, 0, 0, 0, width=3, fill=color, tags="spinner")
+                for color in self.COLORS
+            ]
+        else:
+            self.canvas.itemconfigure("spinner", state="normal")
+        if self._pending_after is None:
+            self._animate()
         return self
     
     def stop(self):
         """Stop the spinner animation"""
         self.is_running = False
-        self.canvas.delete("spinner")
+        if self._pending_after is not None:
+            self.parent.after_cancel(self._pending_after)
+            self._pending_after = None
+        self.canvas.itemconfigure("spinner", state="hidden")
         return self
     
     def _animate(self):
         """Draw the spinner animation frame"""
+        self._pending_after = None
         if not self.is_running:
             return
             
-        self.canvas.delete("spinner")
         center = self.size // 2
-        radius = (self.size // 2) - 5            # Draw spinner segments with different colors
-        for i in range(8):
-            angle = self.angle + (i * 45)
-            # Use a series of blue shades instead of opacity which might not be supported
-            colors = ["#2563eb", "#2563eb", "#3b74ec", "#517eee", "#668fef", "#7c9ff1", "#91b0f3", "#a7c0f5"]
-            color = colors[i % len(colors)]
-            
-            x1 = center + int(radius * 0.6 * (0.5 * (i == 0 or i == 1 or i == 7))) * (1 if i <= 4 else -1)
-            y1 = center + int(radius * 0.6 * (0.5 * (i >= 0 and i <= 2))) * (1 if i >= 2 and i <= 6 else -1)
-            x2 = center + int(radius * (0.5 * (i == 0 or i == 1 or i == 7))) * (1 if i <= 4 else -1)
-            y2 = center + int(radius * (0.5 * (i >= 0 and i <= 2))) * (1 if i >= 2 and i <= 6 else -1)
-            
-            self.canvas.create_line(
-                x1, y1, x2, y2,
-                width=3, fill=color, tags="spinner"
-            )
+        radius = (self.size // 2) - 5
+        inner = radius * 0.6
+        # Rotate the precomputed segment directions by the current angle
+        ca = math.cos(math.radians(self.angle))
+        sa = math.sin(math.radians(self.angle))
+        for line_id, (cx, cy) in zip(self._lines, self._base):
+            rx = cx * ca - cy * sa
+            ry = cx * sa + cy * ca
+            self.canvas.coords(line_id,
+                               center + inner * rx, center + inner * ry,
+                               center + radius * rx, center + radius * ry)
         
         self.angle = (self.angle + 30) % 360
-        if self.is_running:
-            self.parent.after(100, self._animate)
+        self._pending_after = self.parent.after(100, self._animate)
 
 class PricingCalculatorUI:
     def __init__(self, root, icons=None):
         # Store root and icons first - with default value
         self.root = root
         self.icons = icons if icons else {}  # Ensure icons is at least an empty dict
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         logger.debug("Initializing PricingCalculatorUI")
 
         # Initialize variables
         self.error_labels = {}
-        self.entries = {}
+        self.entries = {}  # Field key -> entry widget
         self.var_type = tk.StringVar()
         self.var_quality = tk.StringVar()
         self.var_video_type = tk.StringVar()  # For video specification
@@ -135,16 +329,30 @@ class PricingCalculatorUI:
         # Only keeping video and photography related variables
         
         self.type_produit = ""  # Main variable to store product type consistently
-        self.canvas_saved_selection = []
-        self.other_saved_selection = []
         self.duration_frame = None
         self.entry_duration = None
         self.error_duration = None
         self.quality_combo = None
         self.error_quality = None
-        self.input_timer = None  # Timer for checking "Other" product type input
+        self.type_spinner = None  # Spinner next to the custom product type entry
+        self._field_pool = {}  # Custom-type row slot -> (frame, entry, error label), never destroyed
+        self._current_fields = {}  # Custom-type field key -> pool slot currently shown
+        self._executor = ThreadPoolExecutor(max_workers=2)  # Runs Gemini calls off the Tk thread
+        self._closing = False  # Set once the window is being destroyed
+        self._materials_request = None  # Product type whose recommended materials are awaited
+        self._requirements_request = None  # Custom type whose requirements are awaited
+        self._calc_buffer = []  # Calculation log entries not yet written to disk
+        self._calc_flush_after = None
+        self._debounce_ids = {}  # Callback -> pending after() id, see _debounce
         self.last_other_value = ""  # Track last input value to avoid redundant API calls
-        self.typing_pause_interval = 1000  # Time in milliseconds to wait after typing stops
+        self.typing_pause_interval = 400  # Time in milliseconds to wait after typing stops
+        self._keystroke_times = deque(maxlen=6)  # Recent key release times, to measure typing speed
+        self._trace_after = None  # Pending debounced cost-field refresh
+        self._last_refresh = None  # Last (product type, photo type) refreshed, to skip no-op refreshes
+        self._last_requirements = None  # Requirements used for the last cost field refresh
+        self._wheel_accum = 0  # Mousewheel delta not yet applied to the canvas
+        self._wheel_pending = False
+        self._video_toggle_pending = False  # Whether a duration field update is scheduled
 
         # Create top container frame with proper weight configuration
         self.top_container = ttk.Frame(self.root)
@@ -166,19 +374,9 @@ class PricingCalculatorUI:
         self.create_button_section()
         self.create_result_section()
 
-        # Configure layout - ensure equal weight for columns
-        self.main_frame.columnconfigure(0, weight=1)
-        self.main_frame.columnconfigure(1, weight=1)
-        # Configure layout - give more weight to material and result sections
-        self.main_frame.rowconfigure(0, weight=0)  # Header row
-        self.main_frame.rowconfigure(1, weight=3)  # Materials row
-        self.main_frame.rowconfigure(2, weight=0)  # Error section
-        self.main_frame.rowconfigure(3, weight=0)  # Buttons row
-        self.main_frame.rowconfigure(4, weight=5)  # Results section (increase weight for more vertical space)
-        self.main_frame.rowconfigure(5, weight=0)  # Bottom row (for reset button)
-
         # Bind the Other type entry field created in create_artist_section
-        self.entry_other_type.bind("<FocusOut>", self.update_additional_costs_for_other_type)
+        self.entry_other_type.bind("<FocusOut>", self._check_other_value)
+        self.entry_other_type.bind("<KeyRelease>", self.start_input_check_timer)
         self.var_type.trace("w", self.toggle_other_type_entry)
 
         # Add label & error tracking for market
@@ -207,11 +405,12 @@ class PricingCalculatorUI:
         # Create window in canvas for the main frame
         self.canvas_window = self.main_canvas.create_window((0, 0), window=self.main_frame, anchor="nw", tags="self.main_frame")
         
-        # Configure the main frame with proper weights
+        # Configure layout - ensure equal weight for columns
         self.main_frame.columnconfigure(0, weight=1)
         self.main_frame.columnconfigure(1, weight=1)
-        self.main_frame.rowconfigure(0, weight=1)  # Artist & Cost section
-        self.main_frame.rowconfigure(1, weight=2)  # Materials section (middle)
+        # Configure layout - give more weight to material and result sections
+        self.main_frame.rowconfigure(0, weight=0)  # Artist & Cost section
+        self.main_frame.rowconfigure(1, weight=3)  # Materials section (middle)
         self.main_frame.rowconfigure(2, weight=0)  # Error section
         self.main_frame.rowconfigure(3, weight=0)  # Middle divider (where calculate button will be)
         self.main_frame.rowconfigure(4, weight=5)  # Results section (increase weight for more vertical space)
@@ -238,7 +437,7 @@ class PricingCalculatorUI:
         artist_label.pack(side="left")
         artist_info = ttk.Label(artist_label_frame, text=" ℹ", foreground="blue", cursor="question_arrow")
         artist_info.pack(side="left")
-        ToolTip(artist_info, "Enter the artist's name. If the artist is recognized, this may influence the price recommendation.")
+        SharedToolTip.register(artist_info, "Enter the artist's name. If the artist is recognized, this may influence the price recommendation.")
         
         self.entry_artist = ttk.Entry(self.artist_frame)
         self.entry_artist.grid(row=0, column=1, sticky='ew', padx=5, pady=5)
@@ -250,7 +449,7 @@ class PricingCalculatorUI:
         market_label.pack(side="left")
         market_info = ttk.Label(market_label_frame, text=" ℹ", foreground="blue", cursor="question_arrow")
         market_info.pack(side="left")
-        ToolTip(market_info, "Specify the geographical market where the art will be sold. Different markets have different pricing expectations.")
+        SharedToolTip.register(market_info, "Specify the geographical market where the art will be sold. Different markets have different pricing expectations.")
         
         self.entry_market = ttk.Entry(self.artist_frame)
         self.entry_market.grid(row=1, column=1, sticky='ew', padx=5, pady=5)
@@ -262,7 +461,7 @@ class PricingCalculatorUI:
         product_label.pack(side="left")
         product_info = ttk.Label(product_label_frame, text=" ℹ", foreground="blue", cursor="question_arrow")
         product_info.pack(side="left")
-        ToolTip(product_info, "Select the type of art piece. This affects which fields are shown for dimension input and pricing calculations.")
+        SharedToolTip.register(product_info, "Select the type of art piece. This affects which fields are shown for dimension input and pricing calculations.")
         
         self.type_combo = ttk.Combobox(
             self.artist_frame,
@@ -295,7 +494,7 @@ class PricingCalculatorUI:
         other_label.pack(side="left")
         other_info = ttk.Label(other_label_frame, text=" ℹ", foreground="blue", cursor="question_arrow")
         other_info.pack(side="left")
-        ToolTip(other_info, "Enter a custom art type. Gemini AI will analyze if it's a valid artistic product and determine appropriate dimensions.")
+        SharedToolTip.register(other_info, "Enter a custom art type. Gemini AI will analyze if it's a valid artistic product and determine appropriate dimensions.")
         
         self.entry_other_type = ttk.Entry(other_spec_frame, width=30)
         self.entry_other_type.grid(row=0, column=1, sticky="ew", padx=5, pady=5)
@@ -344,7 +543,7 @@ class PricingCalculatorUI:
         self.photo_style_combo.grid(row=1, column=1, sticky="ew", padx=5, pady=5)
         
         # Connect photo type change to update dimension units
-        self.var_photo_type.trace("w", lambda *args: self.update_cost_fields_labels("Photography"))
+        self.var_photo_type.trace("w", self._on_photo_type_change)
 
         # Hide frame by default
         self.photography_spec_frame.grid_forget()
@@ -382,8 +581,6 @@ class PricingCalculatorUI:
 
         # Hide frame by default
         self.video_spec_frame.grid_forget()
-        
-        self.var_type.trace("w", self.toggle_other_type_entry)
 
     def create_cost_section(self):
         # Right side - costs and time
@@ -410,7 +607,7 @@ class PricingCalculatorUI:
             if tooltip_text:
                 question_label = ttk.Label(frame, text=" ℹ", foreground="blue", cursor="question_arrow")
                 question_label.pack(side="left")
-                ToolTip(question_label, tooltip_text)
+                SharedToolTip.register(question_label, tooltip_text)
             
             self.cost_labels[key] = label  # Save label ref for update later
             entry = ttk.Entry(self.cost_frame)
@@ -420,123 +617,173 @@ class PricingCalculatorUI:
             error_label.grid(row=i, column=2, sticky='w', padx=5, pady=0)
             self.error_labels[key] = error_label
         
-        # Now continue with the dimension fields
-        current_row = 5  # Start after the standard cost fields
-        
-        # Create dimension fields separately for better control
-        # Length field
-        self.length_frame = ttk.Frame(self.cost_frame)
-        self.length_frame.grid(row=current_row, column=0, sticky='e', padx=5, pady=5)
-        self.length_label = ttk.Label(self.length_frame, text="Length (cm):")
-        self.length_label.pack(side="left")
-        self.cost_labels['longueur'] = self.length_label  # Save for later updates
-        
-        self.entry_length = ttk.Entry(self.cost_frame)
-        self.entry_length.grid(row=current_row, column=1, sticky='ew', padx=5, pady=5)
-        self.entries['longueur'] = self.entry_length
-        
-        self.error_length = ttk.Label(self.cost_frame, text="", style='Error.TLabel') # Use Error style
-        self.error_length.grid(row=current_row, column=2, sticky='w', padx=5, pady=0)
-        self.error_labels['longueur'] = self.error_length
-
-        # Width field
-        current_row += 1
-        self.width_frame = ttk.Frame(self.cost_frame)
-        self.width_frame.grid(row=current_row, column=0, sticky='e', padx=5, pady=5)
-        self.width_label = ttk.Label(self.width_frame, text="Width (cm):")
-        self.width_label.pack(side="left")
-        self.cost_labels['largeur'] = self.width_label  # Save for later updates
-        
-        self.entry_width = ttk.Entry(self.cost_frame)
-        self.entry_width.grid(row=current_row, column=1, sticky='ew', padx=5, pady=5)
-        self.entries['largeur'] = self.entry_width
-        
-        self.error_width = ttk.Label(self.cost_frame, text="", style='Error.TLabel') # Use Error style
-        self.error_width.grid(row=current_row, column=2, sticky='w', padx=5, pady=0)
-        self.error_labels['largeur'] = self.error_width
-
-        # Add height field (initially hidden)
-        current_row += 1
-        self.height_frame = ttk.Frame(self.cost_frame)
-        self.height_frame.grid(row=current_row, column=0, sticky='e', padx=5, pady=5)
-        ttk.Label(self.height_frame, text="Height (cm):").pack(side="left")
-        
-        self.entry_height = ttk.Entry(self.cost_frame)
-        self.entry_height.grid(row=current_row, column=1, sticky='ew', padx=5, pady=5)
-        self.entries['hauteur'] = self.entry_height
-        
-        self.error_height = ttk.Label(self.cost_frame, text="", style='Error.TLabel') # Use Error style
-        self.error_height.grid(row=current_row, column=2, sticky='w', padx=5, pady=0)
-        self.error_labels['hauteur'] = self.error_height
-        
-        # Hide height fields initially
-        self.height_frame.grid_remove()
-        self.entry_height.grid_remove()
-        self.error_height.grid_remove()
-
-        # Add weight field (initially hidden)
-        current_row += 1
-        self.weight_frame = ttk.Frame(self.cost_frame)
-        self.weight_frame.grid(row=current_row, column=0, sticky='e', padx=5, pady=5)
-        ttk.Label(self.weight_frame, text="Weight (kg):").pack(side="left")
-        
-        self.entry_weight = ttk.Entry(self.cost_frame)
-        self.entry_weight.grid(row=current_row, column=1, sticky='ew', padx=5, pady=5)
-        self.entries['poids'] = self.entry_weight
-        
-        self.error_weight = ttk.Label(self.cost_frame, text="", style='Error.TLabel') # Use Error style
-        self.error_weight.grid(row=current_row, column=2, sticky='w', padx=5, pady=0)
-        self.error_labels['poids'] = self.error_weight
-        
-        # Hide weight fields initially
-        self.weight_frame.grid_remove()
-        self.entry_weight.grid_remove()
-        self.error_weight.grid_remove()
-
-        # Add quality selection for digital products (initially hidden)
-        current_row += 1
-        self.quality_frame = ttk.Frame(self.cost_frame)
-        self.quality_frame.grid(row=current_row, column=0, sticky='e', padx=5, pady=5)
-        ttk.Label(self.quality_frame, text="Resolution:").pack(side="left")
-        
-        self.quality_combo = ttk.Combobox(self.cost_frame, textvariable=self.var_quality,
-                                          values=["SD (480p)", "HD (720p)", "Full HD (1080p)",
-                                                 "2K (1440p)", "4K (2160p)", "8K (4320p)"],
-                                          state='readonly')
-        self.quality_combo.grid(row=current_row, column=1, sticky='ew', padx=5, pady=5)
-        
-        self.error_quality = ttk.Label(self.cost_frame, text="", style='Error.TLabel') # Use Error style
-        self.error_quality.grid(row=current_row, column=2, sticky='w', padx=5, pady=0)
-        self.error_labels['quality'] = self.error_quality
-        
-        # Hide quality fields initially
-        self.quality_frame.grid_remove()
-        self.quality_combo.grid_remove()
-        self.error_quality.grid_remove()
-
-        # Add duration field (initially hidden)
-        current_row += 1
-        self.duration_frame = ttk.Frame(self.cost_frame)
-        self.duration_frame.grid(row=current_row, column=0, sticky='e', padx=5, pady=5)
-        ttk.Label(self.duration_frame, text="Duration (minutes):").pack(side="left")
-        
-        self.entry_duration = ttk.Entry(self.cost_frame)
-        self.entry_duration.grid(row=current_row, column=1, sticky='ew', padx=5, pady=5)
-        self.entries['duration'] = self.entry_duration
-        
-        self.error_duration = ttk.Label(self.cost_frame, text="", style='Error.TLabel') # Use Error style
-        self.error_duration.grid(row=current_row, column=2, sticky='w', padx=5, pady=0)
-        self.error_labels['duration'] = self.error_duration
-        
-        # Hide duration fields initially
-        self.duration_frame.grid_remove()
-        self.entry_duration.grid_remove()
-        self.error_duration.grid_remove()
-        # Advanced cost factors have been completely removed
+        # Dimension fields are shown right away; optional fields are only
+        # created the first time a product type needs them
+        self.fields = {}
+        for key, _, _, attrs, eager in FIELD_SPECS:
+            if eager:
+                self._show_field(key)
+            else:
+                for attr in attrs:
+                    setattr(self, attr, None)
+
+    def _build_field(self, key):
+        """Create the label frame, input widget and error label for a cost field"""
+        _, text, values, attrs, _ = _FIELD_SPECS_BY_KEY[key]
+        frame = ttk.Frame(self.cost_frame)
+        label = ttk.Label(frame, text=text)
+        label.pack(side="left")
+        self.cost_labels[key] = label  # Save label ref for update later
+        
+        if values:
+            # Resolution is the only combobox field and is read through var_quality
+            widget = ttk.Combobox(self.cost_frame, textvariable=self.var_quality,
+                                  values=values, state='readonly')
+        else:
+            widget = ttk.Entry(self.cost_frame)
+            self.entries[key] = widget
+        
+        error_label = ttk.Label(self.cost_frame, text="", style='Error.TLabel') # Use Error style
+        self.error_labels[key] = error_label
+        
+        field = (frame, widget, error_label)
+        for attr, member in zip(attrs, field):
+            setattr(self, attr, member)
+        self.fields[key] = field
+        return field
+
+    def _ensure_field(self, key):
+        """Return the widgets of a cost field, creating them on first use"""
+        field = self.fields.get(key)
+        if field is None:
+            field = self._build_field(key)
+        return field
+
+    def _show_field(self, key):
+        """Grid a cost field at its fixed row, skipping fields that are already shown"""
+        frame, widget, error_label = self._ensure_field(key)
+        if frame.winfo_manager():
+            return
+        row = FIELD_ROWS[key]
+        frame.grid(row=row, column=0, sticky='e', padx=5, pady=5)
+        widget.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
+        error_label.grid(row=row, column=2, sticky='w', padx=5, pady=0)
+
+    def _hide_field(self, key):
+        """Hide a cost field if it has been created and is currently shown"""
+        field = self.fields.get(key)
+        if field is not None and field[0].winfo_manager():
+            for widget in field:
+                widget.grid_remove()
+
+    def _pool_field(self, slot):
+        """Return the widgets of a custom-type row slot, creating them on first use"""
+        field = self._field_pool.get(slot)
+        if field is not None:
+            return field
+        
+        field_frame = ttk.Frame(self.cost_frame)
+        label = ttk.Label(field_frame, text=_CUSTOM_FIELD_LABELS.get(slot, ""))
+        label.pack(side="left")
+        self.cost_labels[slot] = label  # Generic slots are relabeled for each use
+        
+        # Create entry or combobox
+        if slot == "resolution":
+            entry = ttk.Combobox(self.cost_frame, values=QUALITY_VALUES, state="readonly")
+        else:
+            entry = ttk.Entry(self.cost_frame)
+        
+        error_label = ttk.Label(self.cost_frame, text="", foreground="red")
+        field = (field_frame, entry, error_label)
+        self._field_pool[slot] = field
+        return field
+
+    def _sync_custom_fields(self, field_keys):
+        """
+        Show exactly the given custom-type fields, in order. Rows come from a
+        pool and are only gridded or hidden, never destroyed.
+        """
+        generic_slots = iter(_GENERIC_FIELD_SLOTS)
+        slots = {}
+        for field_key in field_keys:
+            slot = field_key if field_key in _CUSTOM_FIELD_LABELS else next(generic_slots, None)
+            if slot is None:
+                logger.warning("No spare row for custom field %s", field_key)
+                continue
+            slots[field_key] = slot
+        
+        used_slots = set(slots.values())
+        for field_key, slot in self._current_fields.items():
+            if slots.get(field_key) == slot:
+                continue
+            field = self._field_pool[slot]
+            # Unregister the row only where it is still the registered widget
+            if self.entries.get(field_key) is field[1]:
+                del self.entries[field_key]
+            if self.error_labels.get(field_key) is field[2]:
+                del self.error_labels[field_key]
+            standard = self.fields.get(field_key)
+            if standard is not None:
+                # The row shadowed a standard field of the same key, e.g. duration
+                if not _FIELD_SPECS_BY_KEY[field_key][2]:
+                    self.entries.setdefault(field_key, standard[1])
+                self.error_labels.setdefault(field_key, standard[2])
+            if slot in used_slots:
+                # Generic row handed to another field, drop the old value
+                field[1].delete(0, tk.END)
+            else:
+                for widget in field:
+                    widget.grid_remove()
+        
+        for row, (field_key, slot) in enumerate(slots.items(), start=_CUSTOM_FIELDS_ROW):
+            field_frame, entry, error_label = self._pool_field(slot)
+            if slot not in _CUSTOM_FIELD_LABELS:
+                self.cost_labels[slot].config(text=f"{field_key.capitalize()}:")
+            self.entries[field_key] = entry
+            self.error_labels[field_key] = error_label
+            if int(field_frame.grid_info().get("row", -1)) == row:
+                continue  # Already shown at the right row
+            logger.debug("Showing field for %s", field_key)
+            field_frame.grid(row=row, column=0, sticky='e', padx=5, pady=5)
+            entry.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
+            error_label.grid(row=row, column=2, sticky='w', padx=5, pady=0)
+        self._current_fields = slots
+
+    def _debounce(self, ms, fn):
+        """Call fn once ms milliseconds have passed without another _debounce of the same fn"""
+        self._cancel_debounce(fn)
+
+        def fire():
+            del self._debounce_ids[fn]
+            fn()
+
+        self._debounce_ids[fn] = self.root.after(ms, fire)
+
+    def _cancel_debounce(self, fn):
+        """Drop a pending debounced call of fn, if any"""
+        after_id = self._debounce_ids.pop(fn, None)
+        if after_id:
+            self.root.after_cancel(after_id)
+
+    def _schedule_refresh(self, product_type):
+        """Coalesce bursts of type/photo-type changes into a single cost-field refresh"""
+        if self._trace_after:
+            self.root.after_cancel(self._trace_after)
+        self._trace_after = self.root.after(150, lambda: self._dispatch_refresh(product_type))
+
+    def _dispatch_refresh(self, product_type):
+        """Refresh the cost fields unless nothing changed since the last refresh"""
+        self._trace_after = None
+        refresh_key = (product_type, self.var_photo_type.get())
+        if refresh_key == self._last_refresh:
+            return
+        self._last_refresh = refresh_key
+        self.update_cost_fields_labels(product_type)
 
     def update_cost_fields_labels(self, product_type):
         physical_var = self.var_photo_type.get()
-        print(physical_var)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("photo_type=%s", physical_var)
         
         # Make sure we have a valid product type
         if not product_type:
@@ -544,33 +791,33 @@ class PricingCalculatorUI:
             
         # Get product requirements from API
         try:
-            requirements = gemini_api.get_product_type_requirements(product_type)
-            # Convert requirements to dictionary if it's a string
-            if isinstance(requirements, str):
-                requirements = {
-                    "is_digital": "digital" in requirements.lower(),
-                    "is_3d": any(term in requirements.lower() for term in ["3d", "three-dimensional", "sculpture", "installation"]),
-                    "needs_height": any(term in requirements.lower() for term in []),
-                    "needs_weight": any(term in requirements.lower() for term in ["weight", "mass", "size", "dimensions", "physical"]),
-                    "needs_duration": any(term in requirements.lower() for term in ["video", "videography", "film", "filmography"]),
-                    "needs_resolution": "resolution" in requirements.lower() or "quality" in requirements.lower()
-                }
+            requirements = _classify_requirements(product_type.strip().lower())
         except Exception as e:
-            logging.error(f"Error getting requirements: {str(e)}")
-            requirements = {
-                "is_digital": False,
-                "is_3d": False,
-                "is_2d": False,
-                "needs_height": False,
-                "needs_weight": False,
-                "needs_duration": False,
-                "needs_resolution": False
-            }
+            logging.error("Error getting requirements: %s", e)
+            requirements = _DEFAULT_REQUIREMENTS
+            # Ask again next time this type is selected
+            self._last_refresh = None
+        self._last_requirements = requirements
+        self._apply_layout(product_type, requirements, physical_var)
+
+    def _on_photo_type_change(self, *args):
+        """Re-apply the cost field layout when only the photo type changed"""
+        if self.var_type.get() != "Photography":
+            return
+        photo_type = self.var_photo_type.get()
+        if self._last_refresh is None or self._last_refresh[0] != "Photography":
+            # Requirements for Photography haven't been fetched yet
+            self._schedule_refresh("Photography")
+            return
+        self._last_refresh = ("Photography", photo_type)
+        self._apply_layout("Photography", self._last_requirements, photo_type)
 
+    def _apply_layout(self, product_type, requirements, photo_type):
+        """Show/hide and relabel the cost fields for already classified requirements"""
         # Check digital status
-        is_digital_photo = product_type == "Photography" and self.var_photo_type.get() == "Digital"
-        is_digital = product_type in ["Digital", "Video"] or is_digital_photo
-        is_3d = product_type in ["Sculpture", "Installation", "Ceramics"] or requirements.get("is_3d", False)
+        category = _TYPE_CATEGORY.get(product_type)
+        is_digital = _is_digital_product(product_type, photo_type)
+        is_3d = category == "3d" or requirements.is_3d
         
         # Show/hide and configure fields based on product type and requirements
         if is_digital:
@@ -578,42 +825,28 @@ class PricingCalculatorUI:
             self.cost_labels['longueur'].config(text="Length (pixels):")
             self.cost_labels['largeur'].config(text="Width (pixels):")
             # Show quality/resolution field if required
-            if requirements.get("needs_resolution") or product_type == "Photography":
-                self.quality_frame.grid(row=10, column=0, sticky='e', padx=5, pady=5)
-                self.quality_combo.grid(row=10, column=1, sticky='ew', padx=5, pady=5)
-                self.error_quality.grid(row=10, column=2, sticky='w', padx=5, pady=0)
+            if requirements.needs_resolution or category == "photography":
+                self._show_field("quality")
             # Show duration field if required
-            if requirements.get("needs_duration"):
-                self.duration_frame.grid(row=9, column=0, sticky='e', padx=5, pady=5)
-                self.entry_duration.grid(row=9, column=1, sticky='ew', padx=5, pady=5)
-                self.error_duration.grid(row=9, column=2, sticky='w', padx=5, pady=0)
+            if requirements.needs_duration:
+                self._show_field("duration")
             # Never show weight for digital, photography, or video
-            self.weight_frame.grid_remove()
-            self.entry_weight.grid_remove()
-            self.error_weight.grid_remove()
+            self._hide_field("poids")
         else:
             # Physical products use centimeters
             self.cost_labels['longueur'].config(text="Length (cm):")
             self.cost_labels['largeur'].config(text="Width (cm):")
             # Show height field if required
-            if requirements.get("needs_height"):
-                self.height_frame.grid(row=7, column=0, sticky='e', padx=5, pady=5)
-                self.entry_height.grid(row=7, column=1, sticky='ew', padx=5, pady=5)
-                self.error_height.grid(row=7, column=2, sticky='w', padx=5, pady=0)
+            if requirements.needs_height:
+                self._show_field("hauteur")
             # Show weight field only for 3D art types
-            if product_type in ["Sculpture", "Installation", "Ceramics"] or requirements.get("is_3d", False):
-                self.weight_frame.grid(row=8, column=0, sticky='e', padx=5, pady=5)
-                self.entry_weight.grid(row=8, column=1, sticky='ew', padx=5, pady=5)
-                self.error_weight.grid(row=8, column=2, sticky='w', padx=5, pady=0)
+            if is_3d:
+                self._show_field("poids")
             else:
-                self.weight_frame.grid_remove()
-                self.entry_weight.grid_remove()
-                self.error_weight.grid_remove()
+                self._hide_field("poids")
             # Show duration field if required
-            if requirements.get("needs_duration"):
-                self.duration_frame.grid(row=9, column=0, sticky='e', padx=5, pady=5)
-                self.entry_duration.grid(row=9, column=1, sticky='ew', padx=5, pady=5)
-                self.error_duration.grid(row=9, column=2, sticky='w', padx=5, pady=0)
+            if requirements.needs_duration:
+                self._show_field("duration")
 
 
     def create_materials_section(self):
@@ -623,7 +856,7 @@ class PricingCalculatorUI:
         materials_title.pack(side="left")
         materials_info = ttk.Label(materials_title_frame, text=" ℹ", foreground="blue", cursor="question_arrow")
         materials_info.pack(side="left")
-        ToolTip(materials_info, "Select materials from both lists. Gemini AI will verify if these materials are commonly used together for your selected art type. Unusual but valid combinations may result in unique pricing adjustments.")
+        SharedToolTip.register(materials_info, "Select materials from both lists. Gemini AI will verify if these materials are commonly used together for your selected art type. Unusual but valid combinations may result in unique pricing adjustments.")
         
         self.materials_frame = ttk.LabelFrame(self.main_frame, labelwidget=materials_title_frame, padding="10")
         self.materials_frame.grid(row=1, column=0, columnspan=2, sticky="nsew", pady=5)
@@ -639,6 +872,7 @@ class PricingCalculatorUI:
 
         # Left side - Canvas materials
         canvas_frame = ttk.LabelFrame(listbox_container, text="Canvas Materials")
+        self.canvas_frame_parent = canvas_frame  # Retitled when the product type changes
         canvas_frame.pack(side=tk.LEFT, fill="both", expand=True, padx=(0, 5))
         canvas_frame.columnconfigure(0, weight=1)
         canvas_frame.rowconfigure(0, weight=1)
@@ -655,11 +889,12 @@ class PricingCalculatorUI:
         self.listbox_canvas.pack(side="left", fill="both", expand=True)
 
         # Add canvas materials
-        for mat in ["Canvas", "Cotton", "Linen", "Silk", "Paper", "Other"]:
-            self.listbox_canvas.insert(tk.END, mat)
+        self.listbox_canvas.insert(tk.END, *_CANVAS_MATERIALS)
+        self._last_canvas_mats = _CANVAS_MATERIALS  # Current contents, see _set_material_lists
 
         # Right side - Other materials
         other_frame = ttk.LabelFrame(listbox_container, text="Other Materials")
+        self.other_frame_parent = other_frame
         other_frame.pack(side=tk.RIGHT, fill="both", expand=True, padx=(5, 0))
         other_frame.columnconfigure(0, weight=1)
         other_frame.rowconfigure(0, weight=1)
@@ -676,8 +911,8 @@ class PricingCalculatorUI:
         self.listbox_other.pack(side="left", fill="both", expand=True)
 
         # Add other materials
-        for mat in ["Wood", "Acrylic", "Oil", "Clay", "Metal", "Glass", "Plastic", "Other"]:
-            self.listbox_other.insert(tk.END, mat)
+        self.listbox_other.insert(tk.END, *_OTHER_MATERIALS)
+        self._last_other_mats = _OTHER_MATERIALS
 
         # Custom‐materials container with title on top
         self.other_material_frame = ttk.Frame(self.materials_frame)
@@ -707,12 +942,6 @@ class PricingCalculatorUI:
         self.listbox_canvas.bind('<<ListboxSelect>>', lambda e: self.update_material_entry())
         self.listbox_other.bind('<<ListboxSelect>>', lambda e: self.update_material_entry())
 
-        # Bind events to save selection when focus changes
-        self.listbox_canvas.bind('<FocusOut>', self.save_canvas_selection)
-        self.listbox_canvas.bind('<FocusIn>', self.restore_canvas_selection)
-        self.listbox_other.bind('<FocusOut>', self.save_other_selection)
-        self.listbox_other.bind('<FocusIn>', self.restore_other_selection)
-
     def create_error_section(self):
         # Global error message area
         self.global_error_frame = ttk.Frame(self.main_frame)
@@ -724,12 +953,12 @@ class PricingCalculatorUI:
         # Calculate button in the middle with tooltip
         self.calc_button = ttk.Button(self.main_frame, text="Calculate Price", command=self.calculate_price)
         self.calc_button.grid(row=3, column=0, columnspan=2, pady=10)
-        ToolTip(self.calc_button, "Calculate the recommended price based on all entered information. This will consult Gemini AI to validate materials, analyze the artist, and recommend a price range.")
+        SharedToolTip.register(self.calc_button, "Calculate the recommended price based on all entered information. This will consult Gemini AI to validate materials, analyze the artist, and recommend a price range.")
         
         # Reset button in the lower left corner with tooltip
         self.reset_button = ttk.Button(self.main_frame, text="Reset", command=self.reset_form, style='Outline.TButton') # Use Outline style
         self.reset_button.grid(row=5, column=0, sticky="w", padx=10, pady=10)
-        ToolTip(self.reset_button, "Clear all fields and results to start over.")        
+        SharedToolTip.register(self.reset_button, "Clear all fields and results to start over.")        
     
     def create_result_section(self):
         # Result area
@@ -748,47 +977,18 @@ class PricingCalculatorUI:
         result_scrollbar.grid(row=0, column=1, sticky="ns", pady=5)
         self.result_text.config(yscrollcommand=result_scrollbar.set)
 
-    def setup_ui(self):
-        # ... existing UI setup code ...
-        
-        # Make sure the Calculate Price button is properly connected
-        self.calculate_button = ttk.Button(
-            self.bottom_frame, 
-            text="Calculate Price",
-            command=self.calculate_price  # Ensure this is properly connected
-        )
-        self.calculate_button.pack(pady=20)
-        
-        # Make sure the results text widget is properly initialized
-        self.results_frame = ttk.LabelFrame(self.root, text="Results")
-        self.results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Create the results text widget with proper scrollbar
-        self.results_text = tk.Text(self.results_frame, height=10, wrap=tk.WORD)
-        self.results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(self.results_frame, command=self.results_text.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.results_text.config(yscrollcommand=scrollbar.set)
-
     def reset_form(self):
         # Clear all entries
         for entry in self.entries.values():
             if entry:  # Safety check
                 entry.delete(0, tk.END)
         # Clear all comboboxes
-        if hasattr(self, 'type_combo'):
-            self.type_combo.set("")
-        if hasattr(self, 'photo_type_combo'):
-            self.photo_type_combo.set("")
-        if hasattr(self, 'photo_style_combo'):
-            self.photo_style_combo.set("")
-        if hasattr(self, 'video_type_combo'):
-            self.video_type_combo.set("")
-        if hasattr(self, 'video_style_combo'):
-            self.video_style_combo.set("")
-        if hasattr(self, 'quality_combo'):
+        self.type_combo.set("")
+        self.photo_type_combo.set("")
+        self.photo_style_combo.set("")
+        self.video_type_combo.set("")
+        self.video_style_combo.set("")
+        if self.quality_combo is not None:
             self.quality_combo.set("")
         # Clear type selection
         self.var_type.set("")
@@ -800,15 +1000,10 @@ class PricingCalculatorUI:
         self.listbox_canvas.selection_clear(0, tk.END)
         self.listbox_other.selection_clear(0, tk.END)
         # Clear custom material entries
-        if hasattr(self, 'entry_canvas_material'):
-            self.entry_canvas_material.delete(0, tk.END)
-        if hasattr(self, 'entry_other_material'):
-            self.entry_other_material.delete(0, tk.END)
+        self.entry_canvas_material.delete(0, tk.END)
+        self.entry_other_material.delete(0, tk.END)
         # Clear result
-        if hasattr(self, 'result_text'):
-            self.result_text.config(state=tk.NORMAL)
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.config(state=tk.DISABLED)
+        self._show_result("")
         # Clear error messages
         for label in self.error_labels.values():
             if label:  # Safety check
@@ -817,34 +1012,16 @@ class PricingCalculatorUI:
         # Hide optional fields
         self.other_type_frame.grid_forget()
         self.other_material_frame.pack_forget()
-        if hasattr(self, 'height_frame'):
-            self.height_frame.grid_forget()
-        if hasattr(self, 'entry_height'):
-            self.entry_height.grid_forget()
-        if hasattr(self, 'weight_frame'):
-            self.weight_frame.grid_forget()
-        if hasattr(self, 'entry_weight'):
-            self.entry_weight.grid_forget()
-        if hasattr(self, 'duration_frame'):
-            self.duration_frame.grid_forget()
-        if hasattr(self, 'entry_duration'):
-            self.entry_duration.grid_forget()
-        if hasattr(self, 'quality_frame'):
-            self.quality_frame.grid_forget()
-        if hasattr(self, 'quality_combo'):
-            self.quality_combo.grid_forget()
-        if hasattr(self, 'error_quality'):
-            self.error_quality.grid_forget()
+        for key in ("hauteur", "poids", "duration", "quality"):
+            self._hide_field(key)
+        # Re-selecting the same type must show its fields again
+        self._last_refresh = None
         # Remove dynamically added fields for custom product types
-        if hasattr(self, 'additional_cost_rows'):
-            for widget in self.additional_cost_rows:
-                widget.destroy()
-            self.additional_cost_rows = []
-        if hasattr(self, 'additional_fields_entries'):
-            self.additional_fields_entries = {}
+        self._sync_custom_fields(())
+        self._requirements_request = None
+        self.last_other_value = ""
         # Reset focus to the first field
-        if hasattr(self, 'entry_artist'):
-            self.entry_artist.focus_set()
+        self.entry_artist.focus_set()
 
     def toggle_other_type_entry(self, *args):
         """Handle changes in the product type selection"""
@@ -865,35 +1042,34 @@ class PricingCalculatorUI:
             self.type_spinner.canvas.place(relx=0.05, rely=0.5, anchor=tk.W)
             self.type_spinner.start()
             
-            # Setup timer for automatic input checking
-            self.entry_other_type.bind("<KeyRelease>", self.start_input_check_timer)
-            
             # Update status text
             self.typing_status.config(text="Type your custom product type...", foreground="blue")
         else:
             # Hide the custom product type field when not "Other"
             self.other_type_frame.grid_forget()
             
-            # Cancel any pending timer when switching away from Other
-            if self.input_timer:
-                self.root.after_cancel(self.input_timer)
-                self.input_timer = None
+            # Cancel any pending analysis when switching away from Other
+            self._cancel_debounce(self._check_other_value)
+            # Re-analyze the custom type if the user comes back to Other
+            self.last_other_value = ""
+            self._requirements_request = None
                 
             # Stop and remove spinner if it exists
-            if hasattr(self, 'type_spinner'):
+            if self.type_spinner is not None:
                 self.type_spinner.stop()
                 
             # Show specification frames based on product type
-            if product_type == "Photography":
+            category = _TYPE_CATEGORY.get(product_type)
+            if category == "photography":
                 self.photography_spec_frame.grid()
-            elif product_type == "Video":
+            elif category == "video":
                 self.video_spec_frame.grid()
         
         # Clear error messages when changing product type
         self.clear_global_error()
         
         # Update relevant cost fields based on product type
-        self.update_cost_fields_labels(product_type)
+        self._schedule_refresh(product_type)
         
         # Update material section based on product type
         self.update_materials_section_for_product_type(product_type)
@@ -912,129 +1088,107 @@ class PricingCalculatorUI:
     def update_additional_costs_for_other_type(self, event=None):
         """
         When a user enters a custom product type, ask Gemini for required fields and dynamically update the UI.
-        This function loops through the response from Gemini to create appropriate UI elements.
+        The request runs on a worker thread; _apply_requirements updates the UI once it answers.
         """
         logger.debug("==== UPDATING UI FOR CUSTOM PRODUCT TYPE ====")
-        # Clear previous additional fields if they exist
-        if hasattr(self, 'additional_cost_rows'):
-            for widget in self.additional_cost_rows:
-                widget.destroy()
-                
-        # Reset previously created fields
-        if hasattr(self, 'additional_fields_entries'):
-            self.additional_fields_entries = {}
-                
-        self.additional_cost_rows = []
-        self.additional_fields_entries = {}
-        
         # Get the custom product type
         custom_type = self.entry_other_type.get().strip()
         if not custom_type:
             logger.debug("Empty custom type, skipping UI update")
+            self._requirements_request = None
+            self._sync_custom_fields(())
             return
             
-        logger.debug(f"Custom product type entered: {custom_type}")
+        logger.debug("Custom product type entered: %s", custom_type)
         
         # Display a temporary status message
         self.global_error_label.config(text="Analyzing product type requirements...", foreground="blue")
-        self.root.update()  # Force UI update
-        
+        self._fetch_requirements_async(custom_type)
+
+    def _run_in_background(self, on_done, fn, *args):
+        """Run fn(*args) on the worker pool, then call on_done(future) back on the Tk thread"""
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(functools.partial(self._post_result, on_done))
+
+    def _post_result(self, on_done, future):
+        """Hand a finished future to on_done on the Tk thread, unless the window has closed"""
+        if self._closing:
+            return
         try:
-            # Get product requirements from Gemini
-            logger.debug("Getting product requirements from Gemini API")
-            requirements = gemini_api.get_product_type_requirements(custom_type)
-            logger.debug(f"Requirements received: {requirements}")
-            # Convert requirements to dictionary if it's a string
-            if isinstance(requirements, str):
-                req_str = requirements.lower()
-                requirements = {
-                    "is_digital": "digital" in req_str,
-                    "is_3d": any(term in req_str for term in ["3d", "three-dimensional", "sculpture", "installation"]),
-                    "needs_height": "height" in req_str or "dimension" in req_str,
-                    "needs_weight": "weight" in req_str or "mass" in req_str,
-                    "needs_duration": "duration" in req_str or "length" in req_str,
-                    "needs_resolution": "resolution" in req_str or "quality" in req_str
-                }
-            # Clear status message
-            self.clear_global_error()
-            
-            # Update all relevant fields based on Gemini response
-            row_count = 10  # Start after standard fields
-            
-            # First, determine if it's digital to update dimension units
-            is_digital = requirements.get("is_digital", False)
-            if is_digital:
-                logger.debug("Product identified as digital, updating dimension units to pixels")
-                self.cost_labels['longueur'].config(text="Length (pixels):")
-                self.cost_labels['largeur'].config(text="Width (pixels):")
-            else:
-                logger.debug("Product identified as physical, using cm for dimensions")
-                self.cost_labels['longueur'].config(text="Length (cm):")
-                self.cost_labels['largeur'].config(text="Width (cm):")
-            
-            # Loop through requirements and handle each one
-            for field_name, is_required in requirements.items():
-                if (field_name == "is_digital" or field_name == "is_2d" or field_name == "is_3d"):
-                    continue  # Skip metadata fields
-                    
-                if is_required:
-                    # Create UI elements based on the requirement type
-                    field_key = field_name.replace("needs_", "")
-                    logger.debug(f"Adding field for {field_key} (required: {is_required})")
-                    
-                    # Create frame for the field
-                    field_frame = ttk.Frame(self.cost_frame)
-                    field_frame.grid(row=row_count, column=0, sticky='e', padx=5, pady=5)
-                    
-                    # Create label
-                    display_name = field_key.capitalize()
-                    if field_key == "height":
-                        label = ttk.Label(field_frame, text="Height (cm):")
-                    elif field_key == "weight":
-                        label = ttk.Label(field_frame, text="Weight (kg):")
-                    elif field_key == "resolution":
-                        label = ttk.Label(field_frame, text="Resolution:")
-                    elif field_key == "duration":
-                        label = ttk.Label(field_frame, text="Duration (min):")
-                    else:
-                        label = ttk.Label(field_frame, text=f"{display_name}:")
-                        
-                    label.pack(side="left")
-                    
-                    # Create entry or combobox
-                    if field_key == "resolution":
-                        entry = ttk.Combobox(
-                            self.cost_frame,
-                            values=["SD (480p)", "HD (720p)", "Full HD (1080p)", 
-                                    "2K (1440p)", "4K (2160p)", "8K (4320p)"],
-                            state="readonly"
-                        )
-                    else:
-                        entry = ttk.Entry(self.cost_frame)
-                        
-                    entry.grid(row=row_count, column=1, sticky='ew', padx=5, pady=5)
-                    
-                    # Create error label
-                    error_label = ttk.Label(self.cost_frame, text="", foreground="red")
-                    error_label.grid(row=row_count, column=2, sticky='w', padx=5, pady=0)
-                    
-                    # Store references
-                    self.entries[field_key] = entry
-                    self.error_labels[field_key] = error_label
-                    self.additional_cost_rows.append(field_frame)
-                    self.additional_fields_entries[field_key] = entry
-                    
-                    row_count += 1
-            logger.debug("==== FINISHED CUSTOM PRODUCT TYPE UI UPDATE ====")
-                    
+            # Tk may only be touched from the main thread, so hand the result back through after()
+            self.root.after(0, on_done, future)
+        except (RuntimeError, tk.TclError):
+            # The window was destroyed while this call was finishing
+            pass
+
+    def _fetch_requirements_async(self, custom_type):
+        """Get the requirements of custom_type from Gemini without blocking the Tk main loop"""
+        logger.debug("Getting product requirements from Gemini API")
+        self._requirements_request = custom_type
+        self._run_in_background(
+            functools.partial(self._on_requirements_ready, custom_type),
+            _custom_type_requirements, custom_type.lower()
+        )
+
+    def _on_requirements_ready(self, custom_type, future):
+        """Apply a finished requirements request unless it was superseded or Other is no longer selected"""
+        if custom_type != self._requirements_request or custom_type != self.entry_other_type.get().strip():
+            logger.debug("Discarding requirements for outdated type %s", custom_type)
+            if self._requirements_request in (None, custom_type):
+                # No newer request will replace the "Analyzing..." message
+                self._requirements_request = None
+                self.clear_global_error()
+            return
+        self._requirements_request = None
+        try:
+            requirements = future.result()
         except Exception as e:
+            # Let FocusOut or retyping the same text retry the request
+            self.last_other_value = ""
+            self._sync_custom_fields(())
             error_msg = f"Error analyzing product type: {str(e)}"
             logger.error(error_msg)
             self.display_global_error(error_msg)
+            return
+        self._apply_requirements(requirements)
+
+    def _apply_requirements(self, requirements):
+        """Update the dimension units and custom-type fields from Gemini's requirements"""
+        logger.debug("Requirements received: %s", requirements)
+        # Convert requirements to dictionary if it's a string
+        if isinstance(requirements, str):
+            requirements = parse_requirements_text(requirements)
+        # Clear status message
+        self.clear_global_error()
+        
+        # First, determine if it's digital to update dimension units
+        is_digital = requirements.get("is_digital", False)
+        if is_digital:
+            logger.debug("Product identified as digital, updating dimension units to pixels")
+            self.cost_labels['longueur'].config(text="Length (pixels):")
+            self.cost_labels['largeur'].config(text="Width (pixels):")
+        else:
+            logger.debug("Product identified as physical, using cm for dimensions")
+            self.cost_labels['longueur'].config(text="Length (cm):")
+            self.cost_labels['largeur'].config(text="Width (cm):")
+        
+        # Show one field per requirement, skipping metadata fields
+        self._sync_custom_fields([
+            field_name.replace("needs_", "")
+            for field_name, is_required in requirements.items()
+            if is_required and field_name not in ("is_digital", "is_2d", "is_3d")
+        ])
+        logger.debug("==== FINISHED CUSTOM PRODUCT TYPE UI UPDATE ====")
+
+    @staticmethod
+    def _selected_items(listbox):
+        """Return the selected items of a listbox with one bulk get instead of one per index"""
+        items = listbox.get(0, tk.END)
+        return [items[i] for i in listbox.curselection()]
 
     def update_material_entry(self, *args):
-        show_can = any(self.listbox_canvas.get(i)=="Other" for i in self.listbox_canvas.curselection())
-        show_oth = any(self.listbox_other.get(i)=="Other" for i in self.listbox_other.curselection())
+        show_can = "Other" in self._selected_items(self.listbox_canvas)
+        show_oth = "Other" in self._selected_items(self.listbox_other)
 
         if show_can or show_oth:
             self.other_material_frame.pack(fill="x", expand=True, pady=5)
@@ -1051,22 +1205,6 @@ class PricingCalculatorUI:
         else:
             self.other_material_frame.pack_forget()
 
-    def save_canvas_selection(self, event):
-        self.canvas_saved_selection = list(self.listbox_canvas.curselection())
-        
-    def restore_canvas_selection(self, event):
-        if self.canvas_saved_selection:
-            for i in self.canvas_saved_selection:
-                self.listbox_canvas.selection_set(i)
-            
-    def save_other_selection(self, event):
-        self.other_saved_selection = list(self.listbox_other.curselection())
-        
-    def restore_other_selection(self, event):
-        if self.other_saved_selection:
-            for i in self.other_saved_selection:
-                self.listbox_other.selection_set(i)
-            
     def display_global_error(self, message):
         self.global_error_label.config(text=message)
         
@@ -1074,50 +1212,36 @@ class PricingCalculatorUI:
         self.global_error_label.config(text="")
         
     def get_all_materials(self):
+        """Selected materials of both listboxes, with "Other" replaced by the typed material"""
         materials = []
-        
-        # Get canvas materials
-        canvas_indices = self.listbox_canvas.curselection()
-        for i in canvas_indices:
-            mat = self.listbox_canvas.get(i)
-            if (mat == "Other"):
-                custom_mat = self.entry_canvas_material.get().strip()
-                if custom_mat:
-                    materials.append(custom_mat)
-            else:
-                materials.append(mat)
-        
-        # Get other materials
-        other_indices = self.listbox_other.curselection()
-        for i in other_indices:
-            mat = self.listbox_other.get(i)
-            if (mat == "Other"):
-                custom_mat = self.entry_other_material.get().strip()
+        for listbox, custom_entry in ((self.listbox_canvas, self.entry_canvas_material),
+                                      (self.listbox_other, self.entry_other_material)):
+            selected = self._selected_items(listbox)
+            materials.extend(mat for mat in selected if mat != "Other")
+            if "Other" in selected:
+                custom_mat = custom_entry.get().strip()
                 if custom_mat:
                     materials.append(custom_mat)
-            else:
-                materials.append(mat)
         
-        return materials    
+        # Drop duplicates (e.g. the same material typed in both entries), keeping order
+        return list(dict.fromkeys(materials))
     
+    def _show_result(self, text):
+        """Replace the contents of the read-only result area"""
+        self.result_text.config(state=tk.NORMAL)
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, text)
+        self.result_text.config(state=tk.DISABLED)
+
     def calculate_price(self):
         """Calculate price and display results"""
+        # Show progress on the button and keep it from being clicked twice
+        self.calc_button.config(text="Calculating...", state=tk.DISABLED)
+        self.calc_button.update_idletasks()
         try:
-            # Clear previous results and show calculating message
-            self.result_text.config(state=tk.NORMAL)
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, "Calculating price...")
-            self.result_text.config(state=tk.DISABLED)
-            self.root.update()
 
             # Get all input values
-            values = {}
-            for key, entry in self.entries.items():
-                if entry and entry.winfo_exists():
-                    try:
-                        values[key] = float(entry.get())
-                    except ValueError:
-                        values[key] = 0
+            values = {key: _to_float(entry.get()) for key, entry in self.entries.items()}
 
             # Get selected materials
             selected_materials = self.get_all_materials()
@@ -1142,8 +1266,8 @@ class PricingCalculatorUI:
                 raise ValueError("Please select at least one material")
 
             # Determine if product is 3D
-            is_3d = product_type in ["Sculpture", "Installation"] or (
-                hasattr(self, 'height_frame') and self.height_frame.winfo_ismapped()
+            is_3d = _TYPE_CATEGORY.get(product_type) == "3d" or (
+                self.height_frame is not None and self.height_frame.winfo_ismapped()
             )
 
             # Calculate price using pricing module
@@ -1156,209 +1280,231 @@ class PricingCalculatorUI:
                 is_3d=is_3d
             )
 
-            # Format and display results
-            self.result_text.config(state=tk.NORMAL)
-            self.result_text.delete(1.0, tk.END)
-            
             # Create formatted result text
-            result_text = f"Price Calculation Results:\n\n"
-            result_text += f"Base Price: €{result['prix']:.2f}\n"
-            result_text += f"Market Demand: {result['demande_marche']}/10\n"
-            result_text += f"Dimensions: {result['dimensions']}\n"
-            result_text += f"Materials: {result['materiaux']}\n"
+            parts = [
+                "Price Calculation Results:\n\n",
+                f"Base Price: €{result['prix']:.2f}\n",
+                f"Market Demand: {result['demande_marche']}/10\n",
+                f"Dimensions: {result['dimensions']}\n",
+                f"Materials: {result['materiaux']}\n"
+            ]
             if result['artiste_connu']:
-                result_text += "Artist Status: Known artist\n"
+                parts.append("Artist Status: Known artist\n")
             if result.get('height'):
-                result_text += f"Height: {result['height']} cm\n"
+                parts.append(f"Height: {result['height']} cm\n")
             if result.get('weight'):
-                result_text += f"Weight: {result['weight']} kg\n"
-            result_text += f"\nAI Price Recommendation: €{result['gemini_price']}"
+                parts.append(f"Weight: {result['weight']} kg\n")
+            parts.append(f"\nAI Price Recommendation: €{result['gemini_price']}")
 
-            # Insert formatted text
-            self.result_text.insert(tk.END, result_text)
-            self.result_text.config(state=tk.DISABLED)
+            # Display results
+            self._show_result("".join(parts))
 
             # Log the calculation
             self.log_calculation(artist, product_type, result['prix'])
 
         except ValueError as ve:
             # Display validation errors
-            self.result_text.config(state=tk.NORMAL)
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, f"Error: {str(ve)}")
-            self.result_text.config(state=tk.DISABLED)
+            self._show_result(f"Error: {str(ve)}")
             self.display_global_error(str(ve))
             
         except Exception as e:
             # Display other errors
-            self.result_text.config(state=tk.NORMAL)
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, f"Error calculating price: {str(e)}")
-            self.result_text.config(state=tk.DISABLED)
+            self._show_result(f"Error calculating price: {str(e)}")
             self.display_global_error(f"Error calculating price: {str(e)}")
-            logging.error(f"Price calculation error: {str(e)}")
+            logging.error("Price calculation error: %s", e)
+
+        finally:
+            self.calc_button.config(text="Calculate Price", state=tk.NORMAL)
 
     def log_calculation(self, artist, product_type, price):
-        """Log the calculation details"""
+        """Log the calculation details; entries are written to disk in batches"""
+        # Get current timestamp
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Create log entry
+        log_entry = {
+            "timestamp": timestamp,
+            "artist": artist,
+            "product_type": product_type,
+            "price": price
+        }
+        
+        self._calc_buffer.append(log_entry)
+        if len(self._calc_buffer) >= 20:
+            self.flush_calculation_log()
+        elif self._calc_flush_after is None:
+            self._calc_flush_after = self.root.after(2000, self.flush_calculation_log)
+
+    def flush_calculation_log(self):
+        """Write the buffered calculation log entries to disk"""
+        if self._calc_flush_after is not None:
+            self.root.after_cancel(self._calc_flush_after)
+            self._calc_flush_after = None
+        if not self._calc_buffer:
+            return
+        entries, self._calc_buffer = self._calc_buffer, []
         try:
-            # Get current timestamp
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Create log entry
-            log_entry = {
-                "timestamp": timestamp,
-                "artist": artist,
-                "product_type": product_type,
-                "price": price
-            }
-            
-            # Log to file using data_utils
-            data_utils.save_calculation(log_entry)
-            
+            data_utils.save_calculations_batch(entries)
         except Exception as e:
-            logging.error(f"Failed to log calculation: {str(e)}")
+            logging.error("Failed to log calculation: %s", e)
+
+    def _on_close(self):
+        """Flush pending log entries and drop queued Gemini calls before the window goes away"""
+        self._closing = True
+        self.flush_calculation_log()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
     
     def toggle_video_duration(self, *args):
+        """Schedule one duration field update for all video type changes in this event loop turn"""
+        if not self._video_toggle_pending:
+            self._video_toggle_pending = True
+            self.root.after_idle(self._apply_video_duration)
+
+    def _apply_video_duration(self):
         """Handle video duration field visibility based on video type"""
+        self._video_toggle_pending = False
         video_type = self.var_video_type.get()
         
         # Different video types may need different duration handling
         if video_type:
             # Show duration field with appropriate label based on video type
-            self.duration_frame.grid(row=9, column=0, sticky='e', padx=5, pady=5)
-            self.entry_duration.grid(row=9, column=1, sticky='ew', padx=5, pady=5)
-            self.error_duration.grid(row=9, column=2, sticky='w', padx=5, pady=0)
-            
+            self._show_field("duration")
+        
             # Adjust label based on video type
             duration_label = "Duration (sec):" if video_type == "Advertisement" else "Duration (min):"
-              # Check if the duration frame has enough children before accessing
-            if len(self.duration_frame.winfo_children()) > 0:
-                # Find the label in the children
-                for child in self.duration_frame.winfo_children():
-                    if isinstance(child, ttk.Label):
-                        child.config(text=duration_label)
-                        break
-                      # Advanced cost toggle method removed
-            if video_type in ["Short Film", "Documentary", "Animation"]:
-                self.quality_frame.grid(row=10, column=0, sticky='e', padx=5, pady=5)
-                self.quality_combo.grid(row=10, column=1, sticky='ew', padx=5, pady=5)
-                self.error_quality.grid(row=10, column=2, sticky='w', padx=5, pady=0)
+            self.cost_labels['duration'].config(text=duration_label)
+
+            if video_type in _QUALITY_VIDEO_TYPES:
+                self._show_field("quality")
             else:
                 # Hide resolution field for other types
-                self.quality_frame.grid_forget()
-                self.quality_combo.grid_forget()
-                self.error_quality.grid_forget()
+                self._hide_field("quality")
 
     def start_input_check_timer(self, event=None):
         """
         Implements detection of finished typing using an inactivity timeout.
-        Similar to the curses example, this detects when the user stops typing
-        for the specified timeout period and then processes the input.
+        Every key release restarts the timer, so the value is only checked
+        once the user has stopped typing for the specified period.
         """
         logger.debug("==== START INPUT CHECK TIMER ====")
-        # Cancel any existing timer
-        if self.input_timer:
-            self.root.after_cancel(self.input_timer)
-        
-        # Update status to show that we're monitoring typing
-        self.typing_status.config(text="Typing detected... (will analyze when finished)", foreground="blue")
-        
         # Get current value
         current_value = self.entry_other_type.get().strip()
-        logger.debug(f"Current input value: '{current_value}'")
+        logger.debug("Current input value: '%s'", current_value)
         
         # If empty, don't do anything
         if not current_value:
             logger.debug("Empty input, not starting timer")
+            self._cancel_debounce(self._check_other_value)
             self.typing_status.config(text="Please type a product type", foreground="gray")
             return
+        
+        # Update status to show that we're monitoring typing
+        self.typing_status.config(text="Typing detected... (will analyze when finished)", foreground="blue")
             
-        # Set a timer to check if typing has stopped after the specified timeout
-        logger.debug(f"Setting timer for {self.typing_pause_interval}ms to check if typing finished")
-        self.input_timer = self.root.after(self.typing_pause_interval, lambda: self.finish_typing(current_value))
+        # Set a timer to check the value once typing has stopped
+        delay = self._typing_pause(event)
+        logger.debug("Setting timer for %sms to check if typing finished", delay)
+        self._debounce(delay, self._check_other_value)
 
-    def finish_typing(self, value):
+    def _typing_pause(self, event):
+        """
+        How long to wait for more typing: short after a key that ends a word,
+        longer when the user types slowly.
+        """
+        times = self._keystroke_times
+        times.append(time.monotonic())
+        if event is not None and (event.keysym in _END_OF_INPUT_KEYS
+                                  or (event.char and event.char in _END_OF_INPUT_CHARS)):
+            return 100
+        if len(times) > 1 and (times[-1] - times[0]) / (len(times) - 1) > 0.3:
+            return self.typing_pause_interval * 3 // 2
+        return self.typing_pause_interval
+
+    def _check_other_value(self, event=None):
         """
-        Called when typing appears to have stopped (after timeout period).
-        This is similar to the processing that happens in the curses example
-        after the inactivity timeout.
+        Called when typing has paused or the field loses focus. Analyzes the
+        custom product type unless it is unchanged since the last analysis.
         """
-        logger.debug("==== FINISH TYPING CALLBACK ====")
-        # If value hasn't changed since we started the timer
+        logger.debug("==== CHECK OTHER VALUE ====")
+        self._cancel_debounce(self._check_other_value)
+        self._keystroke_times.clear()  # The next burst of typing is measured on its own
+        
         current_value = self.entry_other_type.get().strip()
-        logger.debug(f"Timer value: '{value}', Current value: '{current_value}'")
+        if not current_value or current_value == self.last_other_value:
+            logger.debug("Input '%s' unchanged or empty, skipping analysis", current_value)
+            return
         
-        if value == current_value:
-            # Process the input now that typing appears complete
-            logger.debug("Input appears stable, proceeding with analysis")
-            self.typing_status.config(text="Analyzing product type...", foreground="blue")
-            self.last_other_value = value
-            
-            # Process the input
-            self.update_additional_costs_for_other_type()
-        else:
-            # Value changed during our wait, so restart the timer
-            logger.debug("Input changed during wait, restarting timer")
-            self.start_input_check_timer()
+        # Process the input now that typing appears complete
+        logger.debug("Input appears stable, proceeding with analysis")
+        self.typing_status.config(text="Analyzing product type...", foreground="blue")
+        self.last_other_value = current_value
+        self.update_additional_costs_for_other_type()
 
     def update_materials_section_for_product_type(self, product_type):
         """
         Updates the materials section based on the product type.
         For digital products, shows digital-specific materials instead of physical ones.
-        Now, asks the API for recommended materials for the selected product type.
+        The recommended materials are fetched from the API on a worker thread.
         """
-        # First check if this is a digital product
-        is_digital_photo = product_type == "Photography" and self.var_photo_type.get() == "Digital"
-        is_digital = product_type in ["Digital", "Video"] or is_digital_photo
+        # First check if this is a digital product; the photo type only matters for photography
+        photo_type = self.var_photo_type.get() if _TYPE_CATEGORY.get(product_type) == "photography" else None
+        is_digital = _is_digital_product(product_type, photo_type)
+        preset_key = "digital" if is_digital else "physical"
 
         # Clear previous selections when switching product types
         self.listbox_canvas.selection_clear(0, tk.END)
         self.listbox_other.selection_clear(0, tk.END)
 
-        # Get the labels for the material frames to update them
-        canvas_frame_parent = self.listbox_canvas.master.master
-        other_frame_parent = self.listbox_other.master.master
-
         # Ask the API for recommended materials for this product type
+        self._materials_request = product_type
+        self._run_in_background(
+            functools.partial(self._on_materials_ready, product_type, preset_key),
+            _cached_materials, product_type
+        )
+
+    def _on_materials_ready(self, product_type, preset_key, future):
+        """Show the recommended materials once the API answered, unless the product type changed since"""
+        if product_type != self._materials_request:
+            return
         try:
-            api_materials = gemini_api.get_recommended_materials(product_type)
+            api_materials = future.result()
             # Always expect a dict with 'canvas' and 'other' keys
             if not isinstance(api_materials, dict):
                 api_materials = {}
-            canvas_materials = api_materials.get('canvas')
-            other_materials = api_materials.get('other')
-            # Use defaults if missing or empty
-            if not canvas_materials:
-                canvas_materials = ["Canvas", "Cotton", "Linen", "Silk", "Paper", "Other"]
-            if not other_materials:
-                other_materials = ["Wood", "Acrylic", "Oil", "Clay", "Metal", "Glass", "Plastic", "Other"]
         except Exception as e:
-            logging.error(f"Error getting recommended materials from API: {e}")
-            canvas_materials = ["Canvas", "Cotton", "Linen", "Silk", "Paper", "Other"]
-            other_materials = ["Wood", "Acrylic", "Oil", "Clay", "Metal", "Glass", "Plastic", "Other"]
-
-        # Update material section labels
-        if is_digital:
-            canvas_frame_parent.config(text="Digital Assets")
-            other_frame_parent.config(text="Digital Effects")
-        else:
-            canvas_frame_parent.config(text="Canvas Materials")
-            other_frame_parent.config(text="Other Materials")
-
-        # Clear the existing items in listboxes
-        self.listbox_canvas.delete(0, tk.END)
-        self.listbox_other.delete(0, tk.END)
-
-        # Add new materials from API or defaults
-        for mat in canvas_materials:
-            self.listbox_canvas.insert(tk.END, mat)
-        for mat in other_materials:
-            self.listbox_other.insert(tk.END, mat)
+            logging.error("Error getting recommended materials from API: %s", e)
+            api_materials = {}
+
+        # Show the new materials from API, the preset lists fill in what is missing
+        self._apply_materials(preset_key, api_materials.get('canvas'), api_materials.get('other'))
+
+    def _apply_materials(self, preset_key, canvas_override=None, other_override=None):
+        """Retitle the material frames and fill the listboxes from a preset or the given lists"""
+        canvas_title, other_title, canvas_materials, other_materials = _MAT_PRESETS[preset_key]
+        # This replaces any recommendation still being fetched
+        self._materials_request = None
+        self.canvas_frame_parent.config(text=canvas_title)
+        self.other_frame_parent.config(text=other_title)
+        self._set_material_lists(canvas_override or canvas_materials, other_override or other_materials)
+
+    def _set_material_lists(self, canvas_materials, other_materials):
+        """Replace the listbox contents, leaving a listbox alone when its items are unchanged"""
+        canvas_materials = tuple(canvas_materials)
+        other_materials = tuple(other_materials)
+        if canvas_materials != self._last_canvas_mats:
+            self.listbox_canvas.delete(0, tk.END)
+            self.listbox_canvas.insert(tk.END, *canvas_materials)
+            self._last_canvas_mats = canvas_materials
+        if other_materials != self._last_other_mats:
+            self.listbox_other.delete(0, tk.END)
+            self.listbox_other.insert(tk.END, *other_materials)
+            self._last_other_mats = other_materials
 
     def submit_other_type(self):
         """
         Handles the submission of the custom product type.
-        This method is called when typing in the custom product type field.
+        The API calls run on a worker thread while the loading screen is shown.
         """
         custom_type = self.entry_other_type.get().strip()
         
@@ -1366,80 +1512,67 @@ class PricingCalculatorUI:
             self.typing_status.config(text="Please enter a product type", foreground="red")
             return
             
-        # Create and display the full loading screen
+        # Create the full loading screen; the event loop paints it while the worker runs
         loading_screen = LoadingScreen(self.root, message=f"Analyzing art type: {custom_type}...")
-        self.root.update_idletasks()  # Force UI update to show the loading screen
         
+        # Validate if the product type is recognized as an artistic product
+        self._run_in_background(
+            functools.partial(self._on_custom_type_verified, custom_type, loading_screen),
+            _cached_is_artistic, custom_type.lower()
+        )
+
+    def _on_custom_type_verified(self, custom_type, loading_screen, future):
+        """Second step of submit_other_type: store a valid type and fetch its requirements"""
         try:
-            # Validate if the product type is recognized as an artistic product
-            is_valid = gemini_api.verify_artistic_product(custom_type)
-            
-            if not is_valid:
-                self.typing_status.config(text=f"'{custom_type}' is not recognized as a valid artistic product", foreground="red")
-                return
-                
-            # Store the custom type in the variables
-            self.var_custom_type.set(custom_type)
-            self.type_produit = custom_type  # Set the main product type variable
-            
-            # Update status message
-            self.typing_status.config(text=f"Custom type '{custom_type}' submitted", foreground="green")
-            
-            # Get product requirements for the custom type
-            loading_screen.update_message(f"Getting requirements for {custom_type}...")
-            requirements = gemini_api.get_product_type_requirements(custom_type)
-            
-            # Apply the same changes as in toggle_other_type_entry for the custom type
-            # Handle optional cost fields (height, weight, duration, quality)
-            if requirements.get("needs_height", False) or requirements.get("is_3d", False):
-                self.height_frame.grid(row=7, column=0, sticky='e', padx=5, pady=5)
-                self.entry_height.grid(row=7, column=1, sticky='ew', padx=5, pady=5)
-                self.error_height.grid(row=7, column=2, sticky='w', padx=5, pady=0)
-            else:
-                self.height_frame.grid_forget()
-                self.entry_height.grid_forget()
-                self.error_height.grid_forget()
+            is_valid = future.result()
+        except Exception as e:
+            self.typing_status.config(text=f"Error: {str(e)}", foreground="red")
+            loading_screen.hide()
+            return
             
-            # Handle weight field visibility
-            if requirements.get("needs_weight", False) or requirements.get("is_3d", False):
-                self.weight_frame.grid(row=8, column=0, sticky='e', padx=5, pady=5)
-                self.entry_weight.grid(row=8, column=1, sticky='ew', padx=5, pady=5)
-                self.error_weight.grid(row=8, column=2, sticky='w', padx=5, pady=0)
-            else:
-                self.weight_frame.grid_forget()
-                self.entry_weight.grid_forget()
-                self.error_weight.grid_forget()
+        if not is_valid:
+            self.typing_status.config(text=f"'{custom_type}' is not recognized as a valid artistic product", foreground="red")
+            loading_screen.hide()
+            return
             
-            # Handle duration field visibility
-            if requirements.get("needs_duration", False):
-                self.duration_frame.grid(row=9, column=0, sticky='e', padx=5, pady=5)
-                self.entry_duration.grid(row=9, column=1, sticky='ew', padx=5, pady=5)
-                self.error_duration.grid(row=9, column=2, sticky='w', padx=5, pady=0)
-            else:
-                self.duration_frame.grid_forget()
-                self.entry_duration.grid_forget()
-                self.error_duration.grid_forget()
+        # Store the custom type in the variables
+        self.var_custom_type.set(custom_type)
+        self.type_produit = custom_type  # Set the main product type variable
+        
+        # Update status message
+        self.typing_status.config(text=f"Custom type '{custom_type}' submitted", foreground="green")
+        
+        # Get product requirements for the custom type
+        loading_screen.update_message(f"Getting requirements for {custom_type}...")
+        self._run_in_background(
+            functools.partial(self._on_custom_type_requirements, custom_type, loading_screen),
+            _custom_type_requirements, custom_type.lower()
+        )
+
+    def _on_custom_type_requirements(self, custom_type, loading_screen, future):
+        """Last step of submit_other_type: show the fields and materials the type needs"""
+        try:
+            requirements = future.result()
+            if isinstance(requirements, str):
+                requirements = parse_requirements_text(requirements)
             
-            # Handle resolution field visibility
-            if requirements.get("needs_resolution", False):
-                self.quality_frame.grid(row=10, column=0, sticky='e', padx=5, pady=5)
-                self.quality_combo.grid(row=10, column=1, sticky='ew', padx=5, pady=5)
-                self.error_quality.grid(row=10, column=2, sticky='w', padx=5, pady=0)
-            else:
-                self.quality_frame.grid_forget()
-                self.quality_combo.grid_forget()
-                self.error_quality.grid_forget()
+            # Show each optional cost field the custom type needs, hide the others
+            for key, flags in _OPTIONAL_FIELD_FLAGS:
+                if any(requirements.get(flag, False) for flag in flags):
+                    self._show_field(key)
+                else:
+                    self._hide_field(key)
                 
             # Update material section based on product type requirements
             is_digital = requirements.get("is_digital", False)
             if is_digital:
                 self.cost_labels['longueur'].config(text="Length (pixels):")
                 self.cost_labels['largeur'].config(text="Width (pixels):")
-                self.update_materials_section_for_digital(custom_type)
+                self._apply_materials("digital")
             else:
                 self.cost_labels['longueur'].config(text="Length (cm):")
                 self.cost_labels['largeur'].config(text="Width (cm):")
-                self.update_materials_section_for_physical()
+                self._apply_materials("physical")
                 
             # Clear any previous error messages
             self.clear_global_error()
@@ -1452,56 +1585,6 @@ class PricingCalculatorUI:
             # Hide the loading screen
             loading_screen.hide()
 
-    def update_materials_section_for_digital(self, product_type):
-        """
-        Updates the materials section specifically for digital products.
-        This is called by the submit_other_type method when a custom digital product is submitted.
-        """
-        # Get the labels for the material frames to update them
-        canvas_frame_parent = self.listbox_canvas.master.master
-        other_frame_parent = self.listbox_other.master.master
-        
-        # Update material section labels for digital products
-        canvas_frame_parent.config(text="Digital Assets")
-        other_frame_parent.config(text="Digital Effects")
-        
-        # Clear the existing items in listboxes
-        self.listbox_canvas.delete(0, tk.END)
-        self.listbox_other.delete(0, tk.END)
-        
-        # For custom digital products, use generic digital formats
-        for mat in ["Source File", "PNG", "JPEG", "PDF", "SVG", "GIF", "Other"]:
-            self.listbox_canvas.insert(tk.END, mat)
-            
-        # Generic digital techniques for custom product
-        for mat in ["Digital Drawing", "Generated", "Edited", "Animated", "Interactive", "Coded", "Other"]:
-            self.listbox_other.insert(tk.END, mat)
-
-    def update_materials_section_for_physical(self):
-        """
-        Updates the materials section for physical products.
-        This is called by the submit_other_type method when a custom physical product is submitted.
-        """
-        # Get the labels for the material frames to update them
-        canvas_frame_parent = self.listbox_canvas.master.master
-        other_frame_parent = self.listbox_other.master.master
-        
-        # Reset to original physical materials
-        canvas_frame_parent.config(text="Canvas Materials")
-        other_frame_parent.config(text="Other Materials")
-        
-        # Clear the existing items in listboxes
-        self.listbox_canvas.delete(0, tk.END)
-        self.listbox_other.delete(0, tk.END)
-        
-        # Add physical canvas materials
-        for mat in ["Canvas", "Cotton", "Linen", "Silk", "Paper", "Other"]:
-            self.listbox_canvas.insert(tk.END, mat)
-            
-        # Add physical other materials
-        for mat in ["Wood", "Acrylic", "Oil", "Clay", "Metal", "Glass", "Plastic", "Other"]:
-            self.listbox_other.insert(tk.END, mat)
-
     def store_specified_type(self):
         """Store the user-specified product type in the same variable used for dropdown selection"""
         # Get the text from entry field
@@ -1539,8 +1622,16 @@ class PricingCalculatorUI:
         self.main_canvas.itemconfig(self.canvas_window, width=canvas_width)
         
     def on_mousewheel(self, event):
-        """Handle mousewheel scrolling"""
-        self.main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        """Accumulate mousewheel deltas and scroll once per idle cycle"""
+        self._wheel_accum += event.delta
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            self.root.after_idle(self._flush_wheel)
+
+    def _flush_wheel(self):
+        """Apply the mousewheel deltas accumulated since the last scroll"""
+        delta, self._wheel_accum, self._wheel_pending = self._wheel_accum, 0, False
+        self.main_canvas.yview_scroll(int(-1*(delta/120)), "units")
 
     def update_photo_fields(self, *args):
         """Update the visibility of photography fields based on the selected type"""
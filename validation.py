@@ -1,10 +1,12 @@
-import gemini_api
 import logging
+import os
 import sys
+from functools import lru_cache
 
 # Configure logging
 logger = logging.getLogger("ValidationModule")
-logger.setLevel(logging.DEBUG)
+# Validators run on every form check, so their debug output is opt-in like the UI's
+logger.setLevel(logging.DEBUG if os.environ.get("UI_DEBUG") else logging.INFO)
 
 # Check if handler already exists to avoid duplicate logs
 if not logger.handlers:
@@ -13,36 +15,54 @@ if not logger.handlers:
     handler.setFormatter(formatter)
     logger.addHandler(handler)
 
+@lru_cache(maxsize=256)
+def _cached_verify(custom_type_lower):
+    """Gemini verdict for a normalized custom product type, fetched once per session"""
+    import gemini_api  # Imported here so the Google SDK is only loaded when needed
+    return gemini_api.verify_artistic_product(custom_type_lower)
+
+@lru_cache(maxsize=256)
+def _cached_material_combination(type_produit, materials):
+    """Gemini verdict for a frozenset of materials, so selection order doesn't matter"""
+    import gemini_api  # Imported here so the Google SDK is only loaded when needed
+    return gemini_api.verify_material_combination(type_produit, sorted(materials))
+
+class _NegativeError(ValueError):
+    """A numeric field holds a negative number"""
+
+# Error label text for each way a numeric field can be invalid
+_NUM_ERRORS = {ValueError: "Number required", _NegativeError: "Must be positive"}
+
 def validate_numeric_input(value, field_name, error_labels):
-    logger.debug(f"Validating numeric input for {field_name}: {value}")
+    logger.debug("Validating numeric input for %s: %s", field_name, value)
     try:
         value = float(value)
         if value < 0:
-            error_labels[field_name].config(text="Must be positive")
-            logger.debug(f"Validation failed: {field_name} must be positive")
-            return None, True
-        logger.debug(f"Validation successful for {field_name}: {value}")
-        return value, False
-    except ValueError:
-        error_labels[field_name].config(text="Number required")
-        logger.debug(f"Validation failed: {field_name} requires a number")
+            raise _NegativeError
+    except ValueError as e:
+        error_labels[field_name].config(text=_NUM_ERRORS[type(e)])
+        logger.debug("Validation failed for %s: %s", field_name, _NUM_ERRORS[type(e)])
         return None, True
+    logger.debug("Validation successful for %s: %s", field_name, value)
+    return value, False
 
 def validate_text_input(value, field_name, error_labels):
-    logger.debug(f"Validating text input for {field_name}: {value}")
+    logger.debug("Validating text input for %s: %s", field_name, value)
     if not value:
         error_labels[field_name].config(text="Field required")
-        logger.debug(f"Validation failed: {field_name} is required")
+        logger.debug("Validation failed: %s is required", field_name)
         return False
-    elif not all(c.isalpha() or c.isspace() for c in value):
+    # Letters and whitespace only; the check runs in C instead of per character
+    letters = "".join(value.split())
+    if letters and not letters.isalpha():
         error_labels[field_name].config(text="Invalid format")
-        logger.debug(f"Validation failed: {field_name} has invalid format")
+        logger.debug("Validation failed: %s has invalid format", field_name)
         return False
-    logger.debug(f"Validation successful for {field_name}")
+    logger.debug("Validation successful for %s", field_name)
     return True
 
 def validate_type_product(type_produit, custom_type=None):
-    logger.debug(f"Validating product type: {type_produit}, custom_type: {custom_type}")
+    logger.debug("Validating product type: %s, custom_type: %s", type_produit, custom_type)
     if not type_produit:
         logger.debug("Validation failed: No product type selected")
         return False, "Please select a product type."
@@ -52,14 +72,14 @@ def validate_type_product(type_produit, custom_type=None):
             logger.debug("Validation failed: Custom type not specified")
             return False, "Please specify the product type."
         
-        logger.debug(f"Validating custom product type with Gemini API: {custom_type}")
-        is_valid = gemini_api.verifier_produit_artistique(custom_type)
+        logger.debug("Validating custom product type with Gemini API: %s", custom_type)
+        is_valid = _cached_verify(custom_type.strip().lower())
         if not is_valid:
-            logger.debug(f"Validation failed: '{custom_type}' is not recognized as a valid artistic product")
+            logger.debug("Validation failed: '%s' is not recognized as a valid artistic product", custom_type)
             return False, f"'{custom_type}' is not recognized as a valid artistic product."
-        logger.debug(f"Custom product type validation successful: {custom_type}")
+        logger.debug("Custom product type validation successful: %s", custom_type)
 
-    logger.debug(f"Product type validation successful: {type_produit}")
+    logger.debug("Product type validation successful: %s", type_produit)
     return True, ""
 
 def validate_materials(materiaux_selectionnes, type_produit, bypass_api=True):
@@ -74,7 +94,7 @@ def validate_materials(materiaux_selectionnes, type_produit, bypass_api=True):
     Returns:
         Tuple of (is_valid, error_message)
     """
-    logger.debug(f"Validating materials for {type_produit}: {materiaux_selectionnes}, bypass_api: {bypass_api}")
+    logger.debug("Validating materials for %s: %s, bypass_api: %s", type_produit, materiaux_selectionnes, bypass_api)
     if not materiaux_selectionnes:
         logger.debug("Validation failed: No materials selected")
         return False, "Please select at least one material."
@@ -85,9 +105,9 @@ def validate_materials(materiaux_selectionnes, type_produit, bypass_api=True):
         return True, ""
         
     # Normal validation using the API
-    logger.debug(f"Validating materials combination with Gemini API")
-    if not gemini_api.verifier_combinaison_materiaux(type_produit, materiaux_selectionnes):
-        logger.debug(f"Validation failed: Invalid materials combination for {type_produit}")
+    logger.debug("Validating materials combination with Gemini API")
+    if not _cached_material_combination(type_produit, frozenset(materiaux_selectionnes)):
+        logger.debug("Validation failed: Invalid materials combination for %s", type_produit)
         return False, f"The combination of materials {', '.join(materiaux_selectionnes)} is not realistic for a {type_produit}."
 
     logger.debug("Materials validation successful")
@@ -98,7 +118,7 @@ def validate_market(value, field_name, error_labels):
     Validates a market by calling GPT or performing any necessary checks.
     This simple example just ensures the field is not empty.
     """
-    logger.debug(f"Validating market: {value}")
+    logger.debug("Validating market: %s", value)
     if not value.strip():
         error_labels[field_name].config(text="Invalid market")
         logger.debug("Validation failed: Empty market")